@@ -23,6 +23,10 @@ import os
 import click
 from refract import Refract
 
+# autocode.core loads its subpackages lazily: import them all here so every
+# @register_function endpoint is registered before Refract discovers them.
+from autocode.core import ai, code, planning, vcs, utils  # noqa: F401
+
 # ---------------------------------------------------------------------------
 # Directory helpers
 # ---------------------------------------------------------------------------
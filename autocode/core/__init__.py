@@ -9,6 +9,18 @@ Submodules:
 - core.utils    — Shared utilities
 """
 
-from autocode.core import ai, code, planning, vcs, utils
+import importlib
 
 __all__ = ["ai", "code", "planning", "vcs", "utils"]
+
+
+def __getattr__(name: str):
+    """Import subpackages on first access.
+
+    Importing e.g. autocode.core.code.analyzer (pytest plugin, CLI) no longer
+    pulls in the AI stack (dspy, litellm). autocode.app imports every
+    subpackage explicitly so all endpoints are registered.
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,8 @@ import inspect
 import json
 import logging
 import os
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 import dspy
@@ -265,7 +267,7 @@ def get_dspy_lm(
         logger.error(error_msg)
         raise ValueError(error_msg)
     
-    logger.debug(f"Configurando LM con modelo: {model}")
+    logger.debug("Configurando LM con modelo: %s", model)
     return dspy.LM(
         model, 
         api_key=api_key,
@@ -350,7 +352,7 @@ def generate_with_dspy(
 
     # Ejecutar el módulo DSPy
     try:
-        logger.debug(f"Ejecutando módulo {module_type} con signature {signature_class.__name__}")
+        logger.debug("Ejecutando módulo %s con signature %s", module_type, signature_class.__name__)
         response = _create_and_execute_module(
             lm, signature_class, inputs, module_type, module_kwargs
         )
@@ -386,6 +388,12 @@ def generate_with_dspy(
 # SHARED TOOL HELPERS
 # ============================================================================
 
+# Cache de wrappers por nombre de función: (FunctionInfo de origen, wrapper).
+# Se guarda el FunctionInfo para detectar re-registros (app.clear() + reload)
+# y reconstruir el wrapper solo cuando el objeto del registry cambia.
+_TOOL_WRAPPER_CACHE: Dict[str, tuple] = {}
+
+
 def prepare_chat_tools(enabled_tools: Optional[List[str]] = None) -> list:
     """Prepara tools del registry MCP para DSPy.
     
@@ -399,14 +407,37 @@ def prepare_chat_tools(enabled_tools: Optional[List[str]] = None) -> list:
         Lista de funciones wrapper listas para usar como tools en DSPy.
     """
     mcp_functions = Refract.current().get_functions_for_interface("mcp")
+    # Set de búsqueda O(1) en lugar de recorrer la lista por cada función
+    enabled = frozenset(enabled_tools) if enabled_tools is not None else None
     tools = []
     for func_info in mcp_functions:
-        if enabled_tools is not None and func_info.name not in enabled_tools:
+        if enabled is not None and func_info.name not in enabled:
             continue
-        tools.append(_create_tool_wrapper(func_info))
+        tools.append(_get_tool_wrapper(func_info))
     return tools
 
 
+def _get_tool_wrapper(func_info) -> Any:
+    """Devuelve el wrapper cacheado para func_info, creándolo si hace falta.
+
+    Los FunctionInfo no cambian tras el registro, así que el wrapper (y su
+    docstring enriquecida) se construye una vez por función en lugar de en
+    cada llamada a chat.
+
+    Args:
+        func_info: FunctionInfo del registry con metadata de la función.
+
+    Returns:
+        Función wrapper lista para usar como tool en DSPy.
+    """
+    cached = _TOOL_WRAPPER_CACHE.get(func_info.name)
+    if cached is not None and cached[0] is func_info:
+        return cached[1]
+    wrapper = _create_tool_wrapper(func_info)
+    _TOOL_WRAPPER_CACHE[func_info.name] = (func_info, wrapper)
+    return wrapper
+
+
 def _create_tool_wrapper(func_info) -> Any:
     """Crea un wrapper de tool DSPy con schema enriquecido.
     
@@ -453,7 +484,7 @@ def _create_tool_wrapper(func_info) -> Any:
 # ============================================================================
 
 # Parámetros a excluir de la introspección (internos de DSPy)
-_EXCLUDED_MODULE_PARAMS = {'self', 'signature', 'tools'}
+_EXCLUDED_MODULE_PARAMS = frozenset({'self', 'signature', 'tools'})
 
 # Descripciones amigables para parámetros conocidos
 _PARAM_DESCRIPTIONS = {
@@ -470,12 +501,30 @@ def _get_type_name(annotation: Any) -> str:
     """
     Obtiene el nombre legible del tipo de una anotación.
     
+    Memoizado por anotación: el conjunto de tipos distintos es pequeño y
+    se repite en cada introspección de módulos DSPy.
+    
     Args:
         annotation: Anotación de tipo de Python
         
     Returns:
         String con el nombre del tipo
     """
+    try:
+        return _get_type_name_cached(annotation)
+    except TypeError:
+        # Anotaciones no hashables (p.ej. Annotated con metadata mutable)
+        return _format_type_name(annotation)
+
+
+@lru_cache(maxsize=None)
+def _get_type_name_cached(annotation: Any) -> str:
+    """Versión cacheada de _format_type_name para anotaciones hashables."""
+    return _format_type_name(annotation)
+
+
+def _format_type_name(annotation: Any) -> str:
+    """Formatea una anotación de tipo como nombre legible (sin cache)."""
     if annotation == inspect.Parameter.empty:
         return 'any'
     if hasattr(annotation, '__name__'):
@@ -483,6 +532,23 @@ def _get_type_name(annotation: Any) -> str:
     return str(annotation).replace('typing.', '')
 
 
+@lru_cache(maxsize=None)
+def _get_init_signature(module_class: type) -> inspect.Signature:
+    """
+    Obtiene (y cachea) la firma del __init__ de una clase de módulo DSPy.
+    
+    Las clases de MODULE_MAP son fijas durante la vida del proceso, así que
+    inspect.signature solo se ejecuta una vez por clase.
+    
+    Args:
+        module_class: Clase de módulo DSPy
+        
+    Returns:
+        Signature del __init__ de la clase
+    """
+    return inspect.signature(module_class.__init__)
+
+
 def get_module_kwargs_schema(module_type: ModuleType) -> Dict[str, Any]:
     """
     Inspecciona la clase DSPy del módulo y extrae sus parámetros del __init__.
@@ -510,7 +576,7 @@ def get_module_kwargs_schema(module_type: ModuleType) -> Dict[str, Any]:
     module_class = MODULE_MAP[module_type]
     
     try:
-        sig = inspect.signature(module_class.__init__)
+        sig = _get_init_signature(module_class)
     except (ValueError, TypeError) as e:
         logger.warning(f"Could not inspect {module_type}.__init__: {e}")
         return {'params': [], 'supports_tools': False}
@@ -563,10 +629,15 @@ def get_module_kwargs_schema(module_type: ModuleType) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_all_module_kwargs_schemas() -> Dict[str, Dict[str, Any]]:
     """
     Obtiene los schemas de kwargs para todos los módulos DSPy disponibles.
     
+    MODULE_MAP es estático, así que los schemas se construyen una sola vez y
+    se reutilizan en cada llamada. El diccionario devuelto es compartido:
+    no debe modificarse.
+    
     Returns:
         Diccionario mapeando module_type a su configuración (params, supports_tools)
         
@@ -577,10 +648,16 @@ def get_all_module_kwargs_schemas() -> Dict[str, Dict[str, Any]]:
     """
     return {
         module_type: get_module_kwargs_schema(module_type)
-        for module_type in MODULE_MAP.keys()
+        for module_type in MODULE_MAP
     }
 
 
+# Último resultado de get_available_tools_info: (FunctionInfo de entrada, tools).
+# El registry devuelve una lista nueva en cada consulta pero con los mismos
+# FunctionInfo mientras no haya re-registro, así que se compara por identidad.
+_TOOLS_INFO_CACHE: Optional[tuple] = None
+
+
 def get_available_tools_info(functions: List[Any] = None) -> List[Dict[str, Any]]:
     """
     Obtiene información de las funciones proporcionadas que pueden usarse como tools.
@@ -594,6 +671,9 @@ def get_available_tools_info(functions: List[Any] = None) -> List[Dict[str, Any]
         - name: Nombre de la función
         - description: Descripción de la función
         - enabled_by_default: Si está habilitada por defecto
+
+        La lista se reutiliza mientras las funciones sean las mismas
+        (mismos objetos FunctionInfo); no debe mutarse.
         
     Example:
         >>> # En interfaces, obtener funciones y pasarlas:
@@ -602,15 +682,26 @@ def get_available_tools_info(functions: List[Any] = None) -> List[Dict[str, Any]
         >>> print([t['name'] for t in tools])
         ['generate_code', 'generate_design', 'generate_answer', ...]
     """
+    global _TOOLS_INFO_CACHE
     if functions is None:
         return []
 
-    tools = []
-    for func_info in functions:
-        tools.append({
+    cached = _TOOLS_INFO_CACHE
+    if (
+        cached is not None
+        and len(cached[0]) == len(functions)
+        and all(a is b for a, b in zip(cached[0], functions))
+    ):
+        return cached[1]
+
+    # Ordenar los FunctionInfo una sola vez y construir los dicts ya en orden
+    tools = [
+        {
             'name': func_info.name,
             'description': func_info.description,
             'enabled_by_default': True  # Por defecto todas habilitadas
-        })
-    
-    return sorted(tools, key=lambda t: t['name'])
+        }
+        for func_info in sorted(functions, key=attrgetter('name'))
+    ]
+    _TOOLS_INFO_CACHE = (tuple(functions), tools)
+    return tools
@@ -4,7 +4,8 @@ High-level pipelines for AI operations.
 This module contains orchestration functions that combine file I/O
 with DSPy generation for complete workflows.
 """
-from typing import Dict, Any, Optional, List, get_args
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, get_args
 import os
 import litellm
 from fastapi import HTTPException
@@ -22,6 +23,9 @@ from autocode.core.ai.dspy_utils import (
 from autocode.core.ai.signatures import ChatSignature
 from autocode.core.ai.streaming import stream_chat
 
+# Máximo de hilos para leer los archivos de un directorio en paralelo
+_MAX_READ_WORKERS = 8
+
 
 def _read_path_content(path: str) -> str:
     """
@@ -42,20 +46,60 @@ def _read_path_content(path: str) -> str:
         except Exception:
             return ""
 
-    contents = []
-    for root, _, files in os.walk(path):
-        for filename in sorted(files):
-            filepath = os.path.join(root, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    contents.append(f.read())
-            except Exception:
-                # Ignorar archivos binarios, sin permisos, etc.
-                continue
+    filepaths = list(_iter_dir_files(path))
+    if not filepaths:
+        return ""
+
+    # La lectura es I/O pura: se solapa en hilos y map() conserva el orden
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(filepaths))) as pool:
+        contents = [c for c in pool.map(_read_text_file, filepaths) if c is not None]
 
     return "\n".join(contents)
 
 
+def _iter_dir_files(path: str) -> Iterator[str]:
+    """
+    Recorre un directorio con os.scandir en el mismo orden que os.walk.
+    
+    Los archivos de cada directorio salen ordenados por nombre antes de
+    descender a los subdirectorios. El tipo se obtiene de la entrada del
+    scandir, sin un stat() extra por archivo, y no se siguen los enlaces
+    simbólicos a directorios.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    files = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry.name)
+        elif not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    for name in sorted(files):
+        yield os.path.join(path, name)
+    for subdir in subdirs:
+        yield from _iter_dir_files(subdir)
+
+
+def _read_text_file(filepath: str) -> Optional[str]:
+    """Lee un archivo de texto; devuelve None si es binario o no se puede leer."""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        # Ignorar archivos binarios, sin permisos, etc.
+        return None
+
+
 @register_function(http_methods=["POST"], interfaces=["api"])
 def calculate_context_usage(
     model: ModelType,
@@ -266,7 +310,7 @@ def get_chat_config() -> ChatConfig:
     """
     try:
         # Obtener lista base de modelos definidos en el sistema
-        base_models = list(get_args(ModelType))
+        base_models = get_args(ModelType)
         
         # Enriquecer con metadata de OpenRouter (sync)
         openrouter_info = fetch_models_info(base_models)
@@ -23,6 +23,9 @@ from autocode.core.ai.signatures import ChatSignature
 
 logger = logging.getLogger(__name__)
 
+# Claves indexadas de trayectorias DSPy: thought_0, tool_name_1...
+_INDEXED_KEY_RE = re.compile(r'(.*)_(\d+)$')
+
 
 # ============================================================================
 # SERIALIZATION UTILITIES
@@ -41,7 +44,7 @@ def _normalize_trajectory(trajectory: Any) -> Any:
     has_indexed_keys = False
 
     for key, value in trajectory.items():
-        match = re.search(r'^(.*)_(\d+)$', key)
+        match = _INDEXED_KEY_RE.match(key)
         if match:
             has_indexed_keys = True
             field_name = match.group(1)
@@ -87,12 +90,17 @@ def _serialize_complex_object(value: Any) -> Any:
         return str(value)
 
 
+# Tipos exactos que se devuelven tal cual (camino rápido sin isinstance)
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _serialize_value(value: Any) -> Any:
     """
     Serializa recursivamente un valor a tipos básicos de Python.
     """
-    if value is None:
-        return None
+    if type(value) in _PRIMITIVE_TYPES:
+        return value
+    # Subclases (enums str/int, etc.), listas y dicts
     if isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, list):
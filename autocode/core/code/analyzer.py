@@ -10,10 +10,12 @@ responsabilidad independiente del snapshot/comparación/persistencia.
 """
 
 import ast
+import hashlib
 import logging
 import math
 import re
-from pathlib import Path
+import threading
+from collections import deque
 from typing import Optional
 
 import lizard
@@ -27,6 +29,18 @@ JS_EXTENSIONS = frozenset({".js", ".mjs", ".jsx"})
 # Regex for counting JS classes (simple heuristic)
 _JS_CLASS_RE = re.compile(r"^\s*(?:export\s+)?class\s+\w+", re.MULTILINE)
 
+# AST nodes whose children may include statements (see walk_statements)
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# Results of analyze_file_metrics keyed by (path, content digest). The same
+# file content is analyzed repeatedly (working-changes polling, before/after
+# pairs of consecutive commits, snapshots); hashing it is far cheaper than lizard.
+_FILE_METRICS_CACHE: dict[tuple[str, bytes], FileMetrics] = {}
+_FILE_METRICS_CACHE_MAX = 1024
+# Reached concurrently from worker threads (review flow, sync endpoints):
+# lookups and FIFO eviction go under the lock, the analysis itself doesn't.
+_FILE_METRICS_CACHE_LOCK = threading.Lock()
+
 
 # ==============================================================================
 # PUBLIC API
@@ -45,10 +59,27 @@ def analyze_file_metrics(path: str, content: str) -> FileMetrics:
         content: File content as string
 
     Returns:
-        FileMetrics with all computed metrics
+        FileMetrics with all computed metrics. Identical (path, content)
+        inputs return the same cached instance, which must not be mutated.
     """
-    ext = Path(path).suffix
-    language = "python" if ext == ".py" else "javascript"
+    key = (path, hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _FILE_METRICS_CACHE_LOCK:
+        cached = _FILE_METRICS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    fm = _compute_file_metrics(path, content)
+    with _FILE_METRICS_CACHE_LOCK:
+        if key not in _FILE_METRICS_CACHE and len(_FILE_METRICS_CACHE) >= _FILE_METRICS_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _FILE_METRICS_CACHE[next(iter(_FILE_METRICS_CACHE))]
+        _FILE_METRICS_CACHE[key] = fm
+    return fm
+
+
+def _compute_file_metrics(path: str, content: str) -> FileMetrics:
+    """Uncached body of analyze_file_metrics."""
+    language = "python" if path.endswith(".py") else "javascript"
 
     # Language-aware line counts
     line_info = count_lines(content, language)
@@ -84,15 +115,15 @@ def analyze_file_metrics(path: str, content: str) -> FileMetrics:
             if "." not in f.name   # skip nested functions (outer.inner noise)
         ]
         classes_info = _build_classes_info(class_ranges, content)
+        # Every ClassDef already has a range: reuse the parse instead of a second one
+        classes_count = len(class_ranges)
     else:
         func_metrics = [
             _to_function_metrics(f, path, _find_js_class_for_func(f))
             for f in lizard_analysis.function_list
         ]
         classes_info = []  # JS: no AST, no class info
-
-    # Class count
-    classes_count = _count_classes(content, language, path)
+        classes_count = _count_classes(content, language, path)
 
     # Aggregates
     complexities = [f.complexity for f in func_metrics]
@@ -158,6 +189,31 @@ def maintainability_index(sloc: int, avg_cc: float, total_loc: int) -> float:
     return max(0.0, min(100.0, mi))
 
 
+def walk_statements(tree: ast.AST):
+    """Yield ``tree`` and its statement nodes in ``ast.walk`` order.
+
+    Imports and class/function definitions can only appear in statement
+    lists (module, compound statements, except handlers and match cases),
+    so expression subtrees are never descended into. This visits a small
+    fraction of the nodes ``ast.walk`` would while yielding the same
+    statements in the same breadth-first order.
+
+    Args:
+        tree: Parsed AST (usually an ``ast.Module``)
+
+    Yields:
+        ``tree`` itself plus every nested statement container node
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        todo.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_CONTAINERS)
+        )
+        yield node
+
+
 def cc_rank(cc: int) -> str:
     """Convert cyclomatic complexity to letter rank.
 
@@ -195,11 +251,14 @@ def _get_python_class_ranges(content: str, path: str) -> list:
     Returns:
         List of (start_line, end_line, class_name) tuples
     """
+    # Fast path: without the keyword there can be no ClassDef, skip the parse
+    if "class" not in content:
+        return []
     try:
         tree = ast.parse(content, filename=path)
         return [
             (node.lineno, node.end_lineno, node.name)
-            for node in ast.walk(tree)
+            for node in walk_statements(tree)
             if isinstance(node, ast.ClassDef)
         ]
     except SyntaxError:
@@ -257,6 +316,9 @@ def _to_function_metrics(func, path: str, class_name: Optional[str] = None) -> F
     _find_js_class_for_func for JS/others) and builds the FunctionMetrics
     dataclass.  Contains no language-detection logic itself.
 
+    All field values come straight from lizard with the right types, so the
+    model is built with ``model_construct`` (no per-function validation).
+
     Args:
         func: lizard.FunctionInfo object
         path: File path for the FunctionMetrics.file field
@@ -269,7 +331,7 @@ def _to_function_metrics(func, path: str, class_name: Optional[str] = None) -> F
     # nd extension provides max_nesting_depth; fall back to top_nesting_level
     nesting = getattr(func, "max_nesting_depth", func.top_nesting_level)
 
-    return FunctionMetrics(
+    return FunctionMetrics.model_construct(
         name=func.name,
         file=path,
         line=func.start_line,
@@ -296,9 +358,11 @@ def _count_classes(content: str, language: str, path: str) -> int:
         Number of class definitions found
     """
     if language == "python":
+        if "class" not in content:
+            return 0
         try:
             tree = ast.parse(content, filename=path)
-            return sum(1 for n in ast.walk(tree) if isinstance(n, ast.ClassDef))
+            return sum(1 for n in walk_statements(tree) if isinstance(n, ast.ClassDef))
         except SyntaxError:
             return 0
     else:
@@ -327,7 +391,7 @@ def _build_classes_info(class_ranges: list, content: str) -> list:
             1 for l in class_lines
             if l.strip() and not l.strip().startswith("#")
         )
-        result.append(ClassInfo(name=name, line_start=start, line_end=end, sloc=sloc))
+        result.append(ClassInfo.model_construct(name=name, line_start=start, line_end=end, sloc=sloc))
     return result
 
 
@@ -16,6 +16,7 @@ import posixpath
 import re
 from collections import defaultdict
 from datetime import datetime
+from operator import mul
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Set
 
@@ -33,14 +34,18 @@ from autocode.core.code.models import (
     DependencySliceResult,
     FileDependency,
 )
-from autocode.core.vcs.git import git, git_show, get_tracked_files, get_tracked_files_at_commit
-from autocode.core.code.analyzer import analyze_file_metrics, maintainability_index
+from autocode.core.vcs.git import git, git_show_batch, get_tracked_files, get_tracked_files_at_commit
+from autocode.core.code.analyzer import (
+    JS_EXTENSIONS,
+    analyze_file_metrics,
+    maintainability_index,
+    walk_statements,
+)
 
-from autocode.core.code.coupling import JS_IMPORT_RE
+from autocode.core.code.coupling import JS_IMPORT_RE, has_relative_js_specifier
 
 logger = logging.getLogger(__name__)
 
-JS_EXTENSIONS = frozenset({".js", ".mjs", ".jsx"})
 _ALL_EXTENSIONS = (".py", ".js", ".mjs", ".jsx")
 
 
@@ -70,7 +75,10 @@ def get_architecture_snapshot(path: str = ".", commit_hash: str = "") -> Archite
             commit_short = git("rev-parse", "--short", commit_hash)
             branch = git("log", "-1", "--format=%D", commit_hash)
             all_files = get_tracked_files_at_commit(commit_hash, *_ALL_EXTENSIONS)
-            content_reader = lambda fpath: git_show(f"{commit_hash}:{fpath}") or ""
+            # Each file is read twice (metrics + dependencies): fetch every
+            # blob once through a single git process.
+            blobs = git_show_batch([f"{commit_hash}:{f}" for f in all_files])
+            content_reader = lambda fpath: blobs.get(f"{commit_hash}:{fpath}") or ""
         else:
             # Current mode (unchanged): read files from disk at HEAD
             commit_full = git("rev-parse", "HEAD")
@@ -467,7 +475,7 @@ def _build_architecture_nodes(
             # Create function/class/method child nodes from FileMetrics
             nodes.extend(_create_function_class_nodes(fpath, fm))
         except Exception as e:
-            logger.debug(f"Skip {fpath}: {e}")
+            logger.debug("Skip %s: %s", fpath, e)
             file_node = ArchitectureNode(
                 id=fpath,
                 parent_id=current_parent,
@@ -646,36 +654,31 @@ def _propagate_metrics(nodes: List[ArchitectureNode], root_id: str) -> None:
 
         children = [node_map[cid] for cid in child_ids if cid in node_map]
         dir_node.children_count = len(children)
+        if not children:
+            continue
 
-        # Aggregate metrics
-        total_sloc = sum(c.sloc for c in children)
-        total_loc = sum(c.loc for c in children)
-        total_funcs = sum(c.functions_count for c in children)
-        total_classes = sum(c.classes_count for c in children)
-        max_cc = max((c.max_complexity for c in children), default=0)
+        # Read each child's fields once and aggregate per column
+        slocs, locs, funcs, classes, max_ccs, mis, ccs = zip(*[
+            (c.sloc, c.loc, c.functions_count, c.classes_count,
+             c.max_complexity, c.mi, c.avg_complexity)
+            for c in children
+        ])
+        total_sloc = sum(slocs)
 
         dir_node.sloc = total_sloc
-        dir_node.loc = total_loc
-        dir_node.functions_count = total_funcs
-        dir_node.classes_count = total_classes
-        dir_node.max_complexity = max_cc
+        dir_node.loc = sum(locs)
+        dir_node.functions_count = sum(funcs)
+        dir_node.classes_count = sum(classes)
+        dir_node.max_complexity = max(max_ccs)
 
         # LOC-weighted averages for MI and CC
         if total_sloc > 0:
-            dir_node.mi = round(
-                sum(c.mi * c.sloc for c in children) / total_sloc, 2
-            )
-            dir_node.avg_complexity = round(
-                sum(c.avg_complexity * c.sloc for c in children) / total_sloc, 2
-            )
-        elif children:
+            dir_node.mi = round(sum(map(mul, mis, slocs)) / total_sloc, 2)
+            dir_node.avg_complexity = round(sum(map(mul, ccs, slocs)) / total_sloc, 2)
+        else:
             # If no SLOC, use simple average
-            dir_node.mi = round(
-                sum(c.mi for c in children) / len(children), 2
-            )
-            dir_node.avg_complexity = round(
-                sum(c.avg_complexity for c in children) / len(children), 2
-            )
+            dir_node.mi = round(sum(mis) / len(children), 2)
+            dir_node.avg_complexity = round(sum(ccs) / len(children), 2)
 
 
 def _compute_depths(
@@ -684,10 +687,17 @@ def _compute_depths(
     depths: Dict[str, int],
     current_depth: int,
 ) -> None:
-    """Recursively compute depth of each node from root."""
-    depths[node_id] = current_depth
-    for child_id in children_map.get(node_id, []):
-        _compute_depths(child_id, children_map, depths, current_depth + 1)
+    """Compute depth of each node from root.
+
+    Walks the tree with an explicit stack so deep directory hierarchies
+    don't pay one Python frame per level (or hit the recursion limit).
+    """
+    stack = [(node_id, current_depth)]
+    while stack:
+        nid, depth = stack.pop()
+        depths[nid] = depth
+        child_depth = depth + 1
+        stack.extend((child_id, child_depth) for child_id in children_map.get(nid, ()))
 
 
 # ==============================================================================
@@ -727,7 +737,7 @@ def _resolve_file_dependencies(
 
     # Separate by language
     py_files = [f for f in all_files if f.endswith(".py")]
-    js_files = [f for f in all_files if Path(f).suffix in JS_EXTENSIONS]
+    js_files = [f for f in all_files if posixpath.splitext(f)[1] in JS_EXTENSIONS]
 
     # Build lookup structures
     file_set: Set[str] = set(all_files)
@@ -1129,18 +1139,30 @@ def _collect_python_file_deps(
     edges: Dict[Tuple[str, str], Set[str]],
     content_reader=None,
 ) -> None:
-    """Collect file-level dependencies from Python files using AST."""
+    """Collect file-level dependencies from Python files using AST.
+
+    Files are first scanned with a single regex for any top-level package
+    name as a whole word; only files that can contain an internal import are
+    parsed. False positives just cost a parse, so results are unchanged.
+    """
+    if not top_packages:
+        return
     if content_reader is None:
         content_reader = lambda fpath: Path(fpath).read_text(encoding="utf-8")
+    package_re = re.compile(
+        r"(?<!\w)(?:" + "|".join(map(re.escape, sorted(top_packages))) + r")(?!\w)"
+    )
     for fpath in py_files:
         try:
             content = content_reader(fpath)
+            if not package_re.search(content):
+                continue
             tree = ast.parse(content, filename=fpath)
         except Exception:
-            logger.debug(f"Skipping {fpath} for dependency analysis (parse error)")
+            logger.debug("Skipping %s for dependency analysis (parse error)", fpath)
             continue
 
-        for node in ast.walk(tree):
+        for node in walk_statements(tree):
             if isinstance(node, ast.ImportFrom) and node.module:
                 if not _is_internal_module(node.module, top_packages):
                     continue
@@ -1181,7 +1203,9 @@ def _collect_js_file_deps(
         try:
             content = content_reader(fpath)
         except Exception:
-            logger.debug(f"Skipping {fpath} for JS dependency analysis")
+            logger.debug("Skipping %s for JS dependency analysis", fpath)
+            continue
+        if not has_relative_js_specifier(content):
             continue
 
         file_dir = posixpath.dirname(fpath.replace("\\", "/"))
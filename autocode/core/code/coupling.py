@@ -15,13 +15,19 @@ import logging
 import posixpath
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from autocode.core.code.analyzer import JS_EXTENSIONS, walk_statements
 from autocode.core.code.models import PackageCoupling
 
 logger = logging.getLogger(__name__)
 
-JS_EXTENSIONS = frozenset({".js", ".mjs", ".jsx"})
+# Maximum threads used to read and scan files in analyze_coupling()
+_MAX_WORKERS = 8
+
+# Suffix tuple for str.endswith (no Path/suffix allocation per file)
+_JS_SUFFIXES = tuple(JS_EXTENSIONS)
 
 # Matches: import ... from '...' and export ... from '...'
 # Captures the module specifier in the named group "module"
@@ -33,6 +39,16 @@ JS_IMPORT_RE = re.compile(
 )
 
 
+def has_relative_js_specifier(content: str) -> bool:
+    """Cheap literal pre-check before scanning content with JS_IMPORT_RE.
+
+    Only relative specifiers ('./x', "../y") are internal, and the module
+    group starts right after the quote, so a file with no quote followed by
+    '.' can't yield an internal import and the regex scan can be skipped.
+    """
+    return "'." in content or '".' in content
+
+
 def analyze_coupling(
     files: list[str],
 ) -> tuple[list[PackageCoupling], list[list[str]]]:
@@ -58,25 +74,42 @@ def analyze_coupling(
     top_pkgs = _top_level_packages(files)
     imports_by_pkg: dict[str, set[str]] = defaultdict(set)
 
-    for fpath in files:
-        try:
-            content = Path(fpath).read_text(encoding="utf-8")
-        except Exception:
-            continue
+    # Reading files is I/O-bound: overlap it in a small thread pool.
+    # Results are merged into sets, so completion order doesn't matter.
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(files))) as pool:
+        for pairs in pool.map(lambda f: _extract_file_imports(f, top_pkgs), files):
+            for src_pkg, tgt_pkg in pairs:
+                if src_pkg != tgt_pkg:
+                    imports_by_pkg[src_pkg].add(tgt_pkg)
 
-        ext = Path(fpath).suffix
-        if ext == ".py":
-            pairs = _extract_python_imports(fpath, content, top_pkgs)
-        elif ext in JS_EXTENSIONS:
-            pairs = _extract_js_imports(fpath, content, top_pkgs)
-        else:
-            continue
+    return _compute_coupling_metrics(imports_by_pkg)
 
-        for src_pkg, tgt_pkg in pairs:
-            if src_pkg != tgt_pkg:
-                imports_by_pkg[src_pkg].add(tgt_pkg)
 
-    return _compute_coupling_metrics(imports_by_pkg)
+def _extract_file_imports(fpath: str, top_pkgs: set[str]) -> list[tuple[str, str]]:
+    """Read a file and extract its import pairs according to its language.
+
+    Args:
+        fpath: Relative file path
+        top_pkgs: Set of known top-level project package names
+
+    Returns:
+        List of (src_pkg, tgt_pkg) tuples; empty if the file can't be read
+        or isn't a Python/JS file.
+    """
+    # Pick the extractor first so other files aren't read at all
+    if fpath.endswith(".py"):
+        extract = _extract_python_imports
+    elif fpath.endswith(_JS_SUFFIXES):
+        extract = _extract_js_imports
+    else:
+        return []
+
+    try:
+        content = Path(fpath).read_text(encoding="utf-8")
+    except Exception:
+        return []
+
+    return extract(fpath, content, top_pkgs)
 
 
 def _top_level_packages(files: list[str]) -> set[str]:
@@ -118,6 +151,11 @@ def _extract_python_imports(
         List of (src_pkg, tgt_pkg) tuples. May include same-package pairs;
         the caller is responsible for filtering those out.
     """
+    # An internal import names a project package literally: files that
+    # mention none of them can't contribute pairs, so skip the AST parse.
+    if not any(p in content for p in top_pkgs):
+        return []
+
     try:
         tree = ast.parse(content, filename=fpath)
     except SyntaxError:
@@ -128,15 +166,17 @@ def _extract_python_imports(
     src_pkg = ".".join(src_parts[:2]) if len(src_parts) >= 2 else src_parts[0]
 
     pairs: list[tuple[str, str]] = []
+    # str.startswith takes a tuple: one C-level call per import name
+    prefixes = tuple(top_pkgs)
 
-    for node in ast.walk(tree):
+    for node in walk_statements(tree):
         target = None
         if isinstance(node, ast.ImportFrom) and node.module:
-            if any(node.module.startswith(p) for p in top_pkgs):
+            if node.module.startswith(prefixes):
                 target = node.module
         elif isinstance(node, ast.Import):
             for alias in node.names:
-                if any(alias.name.startswith(p) for p in top_pkgs):
+                if alias.name.startswith(prefixes):
                     tgt_parts = alias.name.split(".")
                     tgt_pkg = (
                         ".".join(tgt_parts[:2])
@@ -181,6 +221,8 @@ def _extract_js_imports(
     file_dir = posixpath.dirname(fpath.replace("\\", "/"))
 
     pairs: list[tuple[str, str]] = []
+    if not has_relative_js_specifier(content):
+        return pairs
 
     for match in JS_IMPORT_RE.finditer(content):
         module = match.group("module")
@@ -13,6 +13,8 @@ Used by:
 - autocode.interfaces.cli (health-check command)
 - tests/health/test_code_health.py (health quality gates for autocode itself)
 """
+import os
+import threading
 import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -28,7 +30,7 @@ from autocode.core.code.models import FileMetrics, PackageCoupling, HealthViolat
 # ==============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HealthConfig:
     """Umbrales de calidad de código leídos de [tool.codehealth] en pyproject.toml.
 
@@ -63,6 +65,10 @@ class HealthConfig:
     max_circular_deps: int = 0
     # Globs a excluir del análisis
     exclude: list[str] = field(default_factory=list)
+    # Procesos para analizar archivos en el plugin pytest (0 o 1 = en serie).
+    # Opt-in: arrancar procesos dentro del pytest del consumidor choca con
+    # xdist/coverage y, con spawn, cada worker reimporta conftest y plugin.
+    parallel_workers: int = 0
 
 
 # ==============================================================================
@@ -70,6 +76,11 @@ class HealthConfig:
 # ==============================================================================
 
 
+# Configs ya leídas: ruta absoluta del pyproject.toml → ((mtime_ns, size), config).
+# HealthConfig es inmutable, así que la misma instancia se comparte entre llamadas.
+_THRESHOLDS_CACHE: dict[str, tuple[tuple[int, int], HealthConfig]] = {}
+
+
 def load_thresholds(project_root: Optional[Path] = None) -> HealthConfig:
     """Lee [tool.codehealth] del pyproject.toml del proyecto.
 
@@ -84,20 +95,31 @@ def load_thresholds(project_root: Optional[Path] = None) -> HealthConfig:
     root = project_root if project_root is not None else Path.cwd()
     toml_path = root / "pyproject.toml"
 
-    if not toml_path.exists():
+    try:
+        st = os.stat(toml_path)
+    except FileNotFoundError:
         return HealthConfig()
 
+    key = os.path.abspath(toml_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _THRESHOLDS_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     with open(toml_path, "rb") as f:
         data = tomllib.load(f)
 
     section = data.get("tool", {}).get("codehealth", {})
-    if not section:
-        return HealthConfig()
+    if section:
+        # Solo pasar campos conocidos para evitar TypeError con campos desconocidos
+        known_fields = set(HealthConfig.__dataclass_fields__)
+        filtered = {k: v for k, v in section.items() if k in known_fields}
+        config = HealthConfig(**filtered)
+    else:
+        config = HealthConfig()
 
-    # Solo pasar campos conocidos para evitar TypeError con campos desconocidos
-    known_fields = set(HealthConfig.__dataclass_fields__)
-    filtered = {k: v for k, v in section.items() if k in known_fields}
-    return HealthConfig(**filtered)
+    _THRESHOLDS_CACHE[key] = (stamp, config)
+    return config
 
 
 # ==============================================================================
@@ -360,6 +382,18 @@ def _build_summary(
 # ==============================================================================
 
 
+_ALL_EXTENSIONS = (".py", ".js", ".mjs", ".jsx")
+
+# FileMetrics por archivo: (project_root, ruta relativa) → ((mtime_ns, size), métricas).
+# La caché de analyze_file_metrics se indexa por contenido, así que igualmente
+# obliga a leer y hashear cada archivo; esta capa usa solo os.stat y evita esa
+# lectura en los health checks repetidos (servidor, MCP). Acotada con FIFO como
+# la del analizador, y con lock porque las funciones se sirven desde hilos.
+_HEALTH_METRICS_CACHE: dict[tuple[str, str], tuple[tuple[int, int], FileMetrics]] = {}
+_HEALTH_METRICS_CACHE_MAX = 4096
+_HEALTH_METRICS_CACHE_LOCK = threading.Lock()
+
+
 @register_function(http_methods=["GET"], interfaces=["api", "mcp", "cli"])
 def get_health_check(strict: bool = False, project_root: str = ".") -> HealthCheckResult:
     """Run code health quality gates against a project.
@@ -375,20 +409,40 @@ def get_health_check(strict: bool = False, project_root: str = ".") -> HealthChe
     from autocode.core.code.coupling import analyze_coupling
     from autocode.core.vcs.git import get_tracked_files
 
-    _ALL_EXTENSIONS = (".py", ".js", ".mjs", ".jsx")
     root = Path(project_root).resolve()
     config = HealthConfig() if strict else load_thresholds(root)
     files = get_tracked_files(*_ALL_EXTENSIONS, cwd=str(root))
 
+    root_key = str(root)
     file_metrics = []
     for fpath in files:
         if any(Path(fpath).match(pattern) for pattern in config.exclude):
             continue
+        abs_path = root / fpath
+        key = (root_key, fpath)
         try:
-            content = (root / fpath).read_text(encoding="utf-8")
-            file_metrics.append(analyze_file_metrics(fpath, content))
+            st = os.stat(abs_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None  # No stamp: analyze without caching
+        if stamp is not None:
+            with _HEALTH_METRICS_CACHE_LOCK:
+                cached = _HEALTH_METRICS_CACHE.get(key)
+            if cached is not None and cached[0] == stamp:
+                file_metrics.append(cached[1])
+                continue
+        try:
+            content = abs_path.read_text(encoding="utf-8")
+            fm = analyze_file_metrics(fpath, content)
         except Exception:
-            pass
+            continue
+        if stamp is not None:
+            with _HEALTH_METRICS_CACHE_LOCK:
+                if key not in _HEALTH_METRICS_CACHE and len(_HEALTH_METRICS_CACHE) >= _HEALTH_METRICS_CACHE_MAX:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del _HEALTH_METRICS_CACHE[next(iter(_HEALTH_METRICS_CACHE))]
+                _HEALTH_METRICS_CACHE[key] = (stamp, fm)
+        file_metrics.append(fm)
 
     coupling = analyze_coupling(files)
     return run_health_check(config, file_metrics, coupling_result=coupling)
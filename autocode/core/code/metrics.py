@@ -13,7 +13,10 @@ El acoplamiento lo delega a coupling.py.
 La persistencia de snapshots la delega a snapshots.py.
 """
 import logging
-from collections import defaultdict
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -21,7 +24,7 @@ from typing import Optional
 from fastapi import HTTPException
 from refract import register_function
 from autocode.core.vcs.git import git, git_show, get_tracked_files
-from autocode.core.code.analyzer import analyze_file_metrics
+from autocode.core.code.analyzer import JS_EXTENSIONS, analyze_file_metrics
 from autocode.core.code.coupling import analyze_coupling
 from autocode.core.code.snapshots import (
     save_snapshot,
@@ -29,6 +32,8 @@ from autocode.core.code.snapshots import (
     load_previous_snapshot,
     load_history_points,
     list_snapshots,
+    load_commit_metrics,
+    save_commit_metrics,
 )
 from autocode.core.code.models import (
     MetricsSnapshot,
@@ -41,8 +46,14 @@ from autocode.core.code.models import (
 
 logger = logging.getLogger(__name__)
 
-JS_EXTENSIONS = frozenset({".js", ".mjs", ".jsx"})
 _ALL_EXTENSIONS = (".py", ".js", ".mjs", ".jsx")
+_ANALYZABLE_EXTENSIONS = frozenset({".py", *JS_EXTENSIONS})
+
+# Full SHA-1 / SHA-256 object id as printed by git rev-parse
+_FULL_HASH_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+# git --name-status letters → CommitFileMetrics.status (anything else: modified)
+_GIT_STATUS_NAMES = {"A": "added", "M": "modified", "D": "deleted"}
 
 
 # ==============================================================================
@@ -68,7 +79,7 @@ def generate_code_metrics() -> MetricsComparison:
         cached = load_snapshot_by_hash(current_hash)
 
         if cached is not None:
-            logger.debug(f"Snapshot en cache para {current_hash[:7]}, reutilizando")
+            logger.debug("Snapshot en cache para %s, reutilizando", current_hash[:7])
             snapshot = cached
         else:
             snapshot = _build_current_snapshot()
@@ -179,37 +190,53 @@ def get_metrics_history(max_count: int = 100) -> MetricsHistory:
 def _build_current_snapshot() -> MetricsSnapshot:
     """Build a full metrics snapshot of the current project state."""
     all_files = get_tracked_files(*_ALL_EXTENSIONS)
-    file_metrics = []
-    for fpath in all_files:
-        try:
-            content = Path(fpath).read_text(encoding="utf-8")
-            fm = analyze_file_metrics(fpath, content)
-            file_metrics.append(fm)
-        except Exception as e:
-            logger.debug(f"Skip {fpath}: {e}")
-
-    # Aggregates
-    all_funcs = [f for fm in file_metrics for f in fm.functions]
-    total_sloc = sum(fm.sloc for fm in file_metrics)
-    total_comments = sum(fm.comments for fm in file_metrics)
-    total_blanks = sum(fm.blanks for fm in file_metrics)
-    total_functions = sum(fm.functions_count for fm in file_metrics)
-    total_classes = sum(fm.classes_count for fm in file_metrics)
-    avg_cc = sum(f.complexity for f in all_funcs) / len(all_funcs) if all_funcs else 0
-    avg_mi = sum(fm.maintainability_index for fm in file_metrics) / len(file_metrics) if file_metrics else 0
 
-    # Complexity distribution
-    dist: dict[str, int] = defaultdict(int)
-    for f in all_funcs:
-        dist[f.rank] += 1
+    # Coupling and the HEAD lookups don't depend on per-file metrics: run them
+    # in background threads (git subprocesses, file reads) while files are analyzed.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        coupling_future = pool.submit(analyze_coupling, all_files)
+        hash_future = pool.submit(git, "rev-parse", "HEAD")
+        short_future = pool.submit(git, "rev-parse", "--short", "HEAD")
+        branch_future = pool.submit(git, "rev-parse", "--abbrev-ref", "HEAD")
+
+        file_metrics = []
+        for fpath in all_files:
+            try:
+                content = Path(fpath).read_text(encoding="utf-8")
+                fm = analyze_file_metrics(fpath, content)
+                file_metrics.append(fm)
+            except Exception as e:
+                logger.debug("Skip %s: %s", fpath, e)
+
+        # Coupling (Python + JS)
+        coupling, circulars = coupling_future.result()
+        commit_hash = hash_future.result()
+        commit_short = short_future.result()
+        branch = branch_future.result()
+
+    # Aggregates: read each file's and function's fields once, sum per column
+    slocs, comments, blanks, funcs, classes, mis = zip(*[
+        (fm.sloc, fm.comments, fm.blanks, fm.functions_count,
+         fm.classes_count, fm.maintainability_index)
+        for fm in file_metrics
+    ]) if file_metrics else ((),) * 6
+    func_fields = [(f.complexity, f.rank) for fm in file_metrics for f in fm.functions]
+    complexities, ranks = zip(*func_fields) if func_fields else ((), ())
+    total_sloc = sum(slocs)
+    total_comments = sum(comments)
+    total_blanks = sum(blanks)
+    total_functions = sum(funcs)
+    total_classes = sum(classes)
+    avg_cc = sum(complexities) / len(complexities) if complexities else 0
+    avg_mi = sum(mis) / len(mis) if mis else 0
 
-    # Coupling (Python + JS)
-    coupling, circulars = analyze_coupling(all_files)
+    # Complexity distribution
+    dist = Counter(ranks)
 
     return MetricsSnapshot(
-        commit_hash=git("rev-parse", "HEAD"),
-        commit_short=git("rev-parse", "--short", "HEAD"),
-        branch=git("rev-parse", "--abbrev-ref", "HEAD"),
+        commit_hash=commit_hash,
+        commit_short=commit_short,
+        branch=branch,
         timestamp=datetime.now().isoformat(),
         files=file_metrics,
         total_files=len(file_metrics),
@@ -267,9 +294,20 @@ def _compare_snapshots(before: Optional[MetricsSnapshot], after: MetricsSnapshot
 
 
 def _analyze_commit(commit_hash: str) -> CommitMetrics:
-    """Analyze the impact of a specific commit on code metrics."""
+    """Analyze the impact of a specific commit on code metrics.
+
+    Results are persisted per full hash and metrics format (see
+    save_commit_metrics): a commit never changes, so later calls skip the
+    git show + lizard work until the analyzer itself changes.
+    """
     # Resolve short hash
     full_hash = git("rev-parse", commit_hash)
+    # Only a real object id is immutable (git echoes unknown refs back)
+    cacheable = _FULL_HASH_RE.fullmatch(full_hash) is not None
+    if cacheable:
+        cached = load_commit_metrics(full_hash)
+        if cached is not None:
+            return cached
     short_hash = git("rev-parse", "--short", commit_hash)
 
     # Get parent
@@ -294,7 +332,7 @@ def _analyze_commit(commit_hash: str) -> CommitMetrics:
 
     avg_delta_cc = round(total_delta_cc / count_cc, 2) if count_cc else 0
 
-    return CommitMetrics(
+    result = CommitMetrics(
         commit_hash=full_hash,
         commit_short=short_hash,
         files=file_metrics,
@@ -304,6 +342,14 @@ def _analyze_commit(commit_hash: str) -> CommitMetrics:
             "files_analyzed": len(file_metrics),
         },
     )
+    if cacheable:
+        try:
+            save_commit_metrics(result)
+        except Exception as e:
+            # The cache is an optimization: a read-only or full disk must
+            # not turn a successful analysis into an error
+            logger.debug("Could not cache metrics for %s: %s", full_hash, e)
+    return result
 
 
 def _get_commit_changed_files(
@@ -333,29 +379,45 @@ def _get_commit_changed_files(
             "diff-tree", "--no-commit-id", "-r", "--name-status", full_hash,
         )
 
+    return _parse_name_status(diff_output)
+
+
+def _parse_name_status(output: str) -> list[tuple[str, str]]:
+    """Parse ``git ... --name-status`` output into analyzable (status, path) pairs.
+
+    Shared by commit and working-tree analysis. Keeps only Python and
+    JavaScript files and maps status letters via _GIT_STATUS_NAMES.
+
+    Args:
+        output: Raw output with one "<letter>\t<path>" line per file
+
+    Returns:
+        List of (status, filepath) tuples where status is one of
+        'added', 'modified', 'deleted'
+    """
     changed: list[tuple[str, str]] = []
-    for line in diff_output.strip().split("\n"):
+    for line in output.strip().split("\n"):
         if not line or "\t" not in line:
             continue
         parts = line.split("\t")
         if len(parts) < 2:
             continue
 
-        status_letter = parts[0].strip()[0]
         fpath = parts[-1].strip()
-
-        ext = Path(fpath).suffix
-        if ext != ".py" and ext not in JS_EXTENSIONS:
+        if not _is_analyzable(fpath):
             continue
 
-        status = {"A": "added", "M": "modified", "D": "deleted"}.get(
-            status_letter, "modified"
-        )
+        status = _GIT_STATUS_NAMES.get(parts[0].strip()[0], "modified")
         changed.append((status, fpath))
 
     return changed
 
 
+def _is_analyzable(fpath: str) -> bool:
+    """True for files analyze_file_metrics handles (Python or JavaScript)."""
+    return os.path.splitext(fpath)[1] in _ANALYZABLE_EXTENSIONS
+
+
 def _analyze_file_pair(
     fpath: str, status: str, parents: list[str], full_hash: str
 ) -> CommitFileMetrics:
@@ -422,35 +484,15 @@ def _analyze_working_changes() -> CommitMetrics:
     # Untracked new files not yet added to index
     untracked_output = git("ls-files", "--others", "--exclude-standard")
 
-    changed_files: list[tuple[str, str]] = []
-
     # Parse diff output: "M\tpath", "A\tpath", "D\tpath"
-    for line in diff_output.strip().split("\n"):
-        if not line or "\t" not in line:
-            continue
-        parts = line.split("\t")
-        if len(parts) < 2:
-            continue
-        status_letter = parts[0].strip()[0]
-        fpath = parts[-1].strip()
-
-        ext = Path(fpath).suffix
-        if ext != ".py" and ext not in JS_EXTENSIONS:
-            continue
-
-        status = {"A": "added", "M": "modified", "D": "deleted"}.get(
-            status_letter, "modified"
-        )
-        changed_files.append((status, fpath))
+    changed_files = _parse_name_status(diff_output)
 
     # Parse untracked files (new files not in index)
-    for fpath in untracked_output.strip().split("\n"):
-        if not fpath:
-            continue
-        ext = Path(fpath).suffix
-        if ext != ".py" and ext not in JS_EXTENSIONS:
-            continue
-        changed_files.append(("added", fpath))
+    changed_files.extend(
+        ("added", fpath)
+        for fpath in untracked_output.strip().split("\n")
+        if fpath and _is_analyzable(fpath)
+    )
 
     # Analyze each file
     file_metrics: list[CommitFileMetrics] = []
@@ -506,7 +548,7 @@ def _analyze_working_file(fpath: str, status: str) -> CommitFileMetrics:
             after_content = Path(fpath).read_text(encoding="utf-8")
             after_fm = analyze_file_metrics(fpath, after_content)
         except Exception as e:
-            logger.debug(f"Cannot read working file {fpath}: {e}")
+            logger.debug("Cannot read working file %s: %s", fpath, e)
 
     d_sloc = (after_fm.sloc if after_fm else 0) - (before_fm.sloc if before_fm else 0)
     d_cc = (after_fm.avg_complexity if after_fm else 0) - (
@@ -3,6 +3,8 @@ parsers
 Registry de parsers de código por extensión.
 """
 
+from functools import lru_cache
+
 from .base import BaseParser
 from .python_parser import PythonParser
 from .js_parser import JSParser
@@ -21,13 +23,22 @@ def get_parser(extension: str) -> BaseParser | None:
     """
     Obtiene una instancia del parser apropiado para la extensión.
     
+    Los parsers no guardan estado, así que se reutiliza una única instancia
+    por extensión en lugar de crear una por archivo.
+    
     Args:
         extension: Extensión del archivo (ej: '.py', '.js')
         
     Returns:
         Instancia del parser o None si no hay parser para esa extensión
     """
-    parser_class = PARSERS.get(extension.lower())
+    return _get_parser_instance(extension.lower())
+
+
+@lru_cache(maxsize=None)
+def _get_parser_instance(extension: str) -> BaseParser | None:
+    """Instancia (cacheada) del parser para una extensión ya normalizada."""
+    parser_class = PARSERS.get(extension)
     if parser_class:
         return parser_class()
     return None
@@ -3,13 +3,19 @@ base.py
 Clase base abstracta para parsers de código.
 """
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from autocode.core.code.models import CodeNode
 
 
+# Nodos parseados, compartidos por todos los parsers:
+# {abspath: ((st_mtime_ns, st_size), file_path, nodes)}
+_FLAT_NODES_CACHE: dict[str, tuple[tuple[int, int], str, List[CodeNode]]] = {}
+
+
 class BaseParser(ABC):
     """
     Parser base para extraer estructura de código.
@@ -17,12 +23,12 @@ class BaseParser(ABC):
     
     El método principal es parse_flat() que devuelve una lista plana
     de nodos con parent_id para evitar recursión en OpenAPI schema.
+    Cada lenguaje implementa _parse_file(); parse_flat() añade la caché.
     """
     
     # Lenguaje que parsea este parser
     language: str = ""
     
-    @abstractmethod
     def parse_flat(self, file_path: str) -> List[CodeNode]:
         """
         Parsea un archivo y devuelve una lista plana de nodos.
@@ -30,6 +36,44 @@ class BaseParser(ABC):
         El primer nodo es siempre el archivo, seguido de sus contenidos
         (imports, clases, funciones, métodos).
         
+        El resultado se cachea por path absoluto y se invalida cuando cambian
+        el mtime o el tamaño del archivo, así que un archivo sin cambios no se
+        vuelve a leer ni a parsear. Los ids de los nodos llevan el file_path
+        recibido, así que la entrada solo se reutiliza si además coincide
+        (p.ej. el mismo archivo pedido con otro path relativo tras un cambio
+        de cwd se vuelve a parsear).
+        
+        Args:
+            file_path: Path al archivo a parsear
+            
+        Returns:
+            Lista plana de CodeNodes con parent_id establecido. El nodo de
+            archivo es una copia propia (el llamador lo re-parenta); el resto
+            se comparte con la caché y el llamador no debe modificarlos.
+        """
+        key = os.path.abspath(file_path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return self._parse_file(file_path)
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _FLAT_NODES_CACHE.get(key)
+        if cached is not None and cached[0] == stamp and cached[1] == file_path:
+            nodes = cached[2]
+        else:
+            nodes = self._parse_file(file_path)
+            _FLAT_NODES_CACHE[key] = (stamp, file_path, nodes)
+        
+        # Solo el nodo de archivo se modifica aguas arriba (parent_id):
+        # copiarlo a él basta, sin duplicar cada clase/función/import
+        return [nodes[0].model_copy(), *nodes[1:]]
+    
+    @abstractmethod
+    def _parse_file(self, file_path: str) -> List[CodeNode]:
+        """
+        Lee y parsea un archivo sin pasar por la caché.
+        
         Args:
             file_path: Path al archivo a parsear
             
@@ -68,18 +112,20 @@ class BaseParser(ABC):
         lines = content.split('\n')
         return sum(1 for line in lines if line.strip())
     
-    def _create_file_node(self, file_path: str) -> CodeNode:
+    def _create_file_node(self, file_path: str, content: Optional[str] = None) -> CodeNode:
         """
         Crea un CodeNode de tipo file.
         
         Args:
             file_path: Path al archivo
+            content: Contenido ya leído del archivo; si es None se lee del disco
             
         Returns:
             CodeNode representando el archivo
         """
         path = Path(file_path)
-        content = self._read_file(file_path)
+        if content is None:
+            content = self._read_file(file_path)
         loc = self._count_lines(content)
         
         return CodeNode(
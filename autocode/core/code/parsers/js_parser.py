@@ -5,13 +5,28 @@ No pretende ser completo, solo extraer estructura básica.
 """
 
 import re
+from bisect import bisect_left
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from autocode.core.code.models import CodeNode
 from .base import BaseParser
 
 
+def _newline_offsets(text: str) -> List[int]:
+    """Posiciones de cada '\\n' en text, en orden creciente.
+
+    La línea (1-indexed) de una posición pos es bisect_left(offsets, pos) + 1,
+    sin volver a contar el prefijo text[:pos] en cada consulta.
+    """
+    offsets = []
+    pos = text.find('\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = text.find('\n', pos + 1)
+    return offsets
+
+
 class JSParser(BaseParser):
     """
     Parser simple para archivos JavaScript usando regex.
@@ -56,14 +71,39 @@ class JSParser(BaseParser):
         re.MULTILINE
     )
     
+    # Cuantificadores posesivos: lo que sigue a cada uno nunca empieza por un
+    # carácter que él mismo acepte, así que devolver caracteres no puede hacer
+    # match; cortar el backtracking da los mismos resultados ~3x más rápido.
     METHOD_PATTERN = re.compile(
-        r'^\s+(?P<async>async\s+)?(?P<name>\w+)\s*\([^)]*\)\s*\{',
+        r'^\s++(?P<async>async\s++)?(?P<name>\w++)\s*+\([^)]*+\)\s*+\{',
+        re.MULTILINE
+    )
+    
+    # Llaves sueltas: el regex salta en C el texto entre ellas
+    BRACE_PATTERN = re.compile(r'[{}]')
+    
+    # Inicios de línea candidatos a declaración (lookahead: no consume texto).
+    # Cubre el prefijo de todos los patrones de nivel superior, así una sola
+    # pasada sobre el contenido sustituye a un finditer por patrón.
+    DECLARATION_PATTERN = re.compile(
+        r'^(?=(?:export\s+)?(?:default\s+)?(?:async\s+)?'
+        r'(?P<keyword>import|class|function|const|let|var)\s)',
         re.MULTILINE
     )
     
-    def parse_flat(self, file_path: str) -> List[CodeNode]:
+    # Palabra clave -> patrones que pueden empezar con ella
+    KEYWORD_PATTERNS = {
+        'import': ('import',),
+        'class': ('class',),
+        'function': ('function',),
+        'const': ('arrow', 'expression'),
+        'let': ('arrow', 'expression'),
+        'var': ('arrow', 'expression'),
+    }
+    
+    def _parse_file(self, file_path: str) -> List[CodeNode]:
         """
-        Parsea un archivo JavaScript y devuelve una lista plana de nodos.
+        Lee y parsea un archivo JavaScript sin pasar por la cache.
         
         Args:
             file_path: Path al archivo .js
@@ -75,7 +115,7 @@ class JSParser(BaseParser):
         
         try:
             content = self._read_file(file_path)
-            file_node = self._create_file_node(file_path)
+            file_node = self._create_file_node(file_path, content)
             nodes.append(file_node)
             
             self._extract_nodes_flat(content, file_path, nodes, parent_id=file_path)
@@ -86,6 +126,43 @@ class JSParser(BaseParser):
             # Cualquier error, devolver solo el nodo de archivo
             return [self._create_file_node(file_path)]
     
+    def _scan_declarations(self, content: str) -> Dict[str, List[re.Match]]:
+        """
+        Recorre el contenido una vez y agrupa los matches por tipo de declaración.
+        
+        Equivale a un finditer de cada patrón: solo se prueban los inicios
+        de línea que encuentra DECLARATION_PATTERN, y un match que empieza
+        dentro del anterior del mismo patrón se descarta (no solapamiento).
+        
+        Args:
+            content: Contenido del archivo
+            
+        Returns:
+            Dict de tipo ('import', 'class', 'function', 'arrow', 'expression')
+            a lista de matches en orden de aparición
+        """
+        patterns = {
+            'import': self.IMPORT_PATTERN,
+            'class': self.CLASS_PATTERN,
+            'function': self.FUNCTION_PATTERN,
+            'arrow': self.ARROW_FUNCTION_PATTERN,
+            'expression': self.FUNCTION_EXPRESSION_PATTERN,
+        }
+        matches = {kind: [] for kind in patterns}
+        last_end = dict.fromkeys(patterns, 0)
+        
+        for candidate in self.DECLARATION_PATTERN.finditer(content):
+            pos = candidate.start()
+            for kind in self.KEYWORD_PATTERNS[candidate.group('keyword')]:
+                if pos < last_end[kind]:
+                    continue
+                match = patterns[kind].match(content, pos)
+                if match:
+                    matches[kind].append(match)
+                    last_end[kind] = match.end()
+        
+        return matches
+    
     def _extract_nodes_flat(
         self, 
         content: str, 
@@ -103,18 +180,20 @@ class JSParser(BaseParser):
             parent_id: ID del nodo padre
         """
         lines = content.split('\n')
+        newlines = _newline_offsets(content)
         existing_ids = set()
+        declarations = self._scan_declarations(content)
         
         # Extraer imports
-        for match in self.IMPORT_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+        for match in declarations['import']:
+            line_num = bisect_left(newlines, match.start()) + 1
             module = match.group('module')
             import_node = self._create_import_node(file_path, module, line_num, parent_id)
             nodes.append(import_node)
         
         # Extraer clases
-        for match in self.CLASS_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+        for match in declarations['class']:
+            line_num = bisect_left(newlines, match.start()) + 1
             name = match.group('name')
             base = match.group('base')
             is_export = match.group('export') is not None
@@ -145,8 +224,8 @@ class JSParser(BaseParser):
             self._extract_methods_flat(class_content, file_path, name, line_num, nodes, class_id)
         
         # Extraer funciones declaradas
-        for match in self.FUNCTION_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+        for match in declarations['function']:
+            line_num = bisect_left(newlines, match.start()) + 1
             name = match.group('name')
             is_async = match.group('async') is not None
             is_export = match.group('export') is not None
@@ -175,8 +254,8 @@ class JSParser(BaseParser):
             existing_ids.add(node_id)
         
         # Extraer arrow functions
-        for match in self.ARROW_FUNCTION_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+        for match in declarations['arrow']:
+            line_num = bisect_left(newlines, match.start()) + 1
             name = match.group('name')
             is_async = match.group('async') is not None
             is_export = match.group('export') is not None
@@ -205,8 +284,8 @@ class JSParser(BaseParser):
             existing_ids.add(node_id)
         
         # Extraer function expressions
-        for match in self.FUNCTION_EXPRESSION_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+        for match in declarations['expression']:
+            line_num = bisect_left(newlines, match.start()) + 1
             name = match.group('name')
             is_async = match.group('async') is not None
             is_export = match.group('export') is not None
@@ -254,10 +333,11 @@ class JSParser(BaseParser):
             nodes: Lista de nodos (se modifica in-place)
             parent_id: ID del nodo padre (la clase)
         """
+        newlines = _newline_offsets(class_content)
         for match in self.METHOD_PATTERN.finditer(class_content):
             name = match.group('name')
             is_async = match.group('async') is not None
-            relative_line = class_content[:match.start()].count('\n')
+            relative_line = bisect_left(newlines, match.start())
             line_num = class_start + relative_line
             
             method_node = CodeNode(
@@ -311,15 +391,16 @@ class JSParser(BaseParser):
             return "", start_line
         
         depth = 1
-        pos = brace_pos + 1
+        pos = len(content)
         
-        while pos < len(content) and depth > 0:
-            char = content[pos]
-            if char == '{':
+        for match in self.BRACE_PATTERN.finditer(content, brace_pos + 1):
+            if match.group() == '{':
                 depth += 1
-            elif char == '}':
+            else:
                 depth -= 1
-            pos += 1
+                if depth == 0:
+                    pos = match.end()
+                    break
         
         block_content = content[brace_pos:pos]
         end_line = start_line + block_content.count('\n')
@@ -15,13 +15,17 @@ class PythonParser(BaseParser):
     """
     Parser para archivos Python usando ast.
     Extrae clases, funciones, imports y su estructura.
+    
+    Los nodos de código se crean con CodeNode.model_construct: todos los
+    valores salen del AST con el tipo correcto, así que se evita revalidar
+    cada clase, función e import del proyecto.
     """
     
     language = "python"
     
-    def parse_flat(self, file_path: str) -> List[CodeNode]:
+    def _parse_file(self, file_path: str) -> List[CodeNode]:
         """
-        Parsea un archivo Python y devuelve una lista plana de nodos.
+        Lee y parsea un archivo Python sin pasar por la cache.
         
         Args:
             file_path: Path al archivo .py
@@ -33,7 +37,7 @@ class PythonParser(BaseParser):
         
         try:
             content = self._read_file(file_path)
-            file_node = self._create_file_node(file_path)
+            file_node = self._create_file_node(file_path, content)
             nodes.append(file_node)
             
             tree = ast.parse(content, filename=file_path)
@@ -43,7 +47,7 @@ class PythonParser(BaseParser):
             
         except SyntaxError:
             # Si hay error de sintaxis, devolver solo el nodo de archivo
-            return [self._create_file_node(file_path)]
+            return [file_node]
         except Exception:
             # Cualquier otro error, devolver solo el nodo de archivo
             return [self._create_file_node(file_path)]
@@ -67,16 +71,21 @@ class PythonParser(BaseParser):
             parent_id: ID del nodo padre
         """
         lines = content.split('\n')
+        # Los nodos AST son clases finales: comparar la clase exacta evita
+        # una llamada a isinstance por nodo
+        _Import, _ImportFrom, _ClassDef = ast.Import, ast.ImportFrom, ast.ClassDef
+        _FD, _AFD = ast.FunctionDef, ast.AsyncFunctionDef
         
         for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.Import):
+            cls = node.__class__
+            if cls is _Import:
                 for alias in node.names:
                     import_node = self._create_import_node(
                         file_path, alias.name, node.lineno, node.lineno, parent_id
                     )
                     nodes.append(import_node)
             
-            elif isinstance(node, ast.ImportFrom):
+            elif cls is _ImportFrom:
                 module = node.module or ''
                 names = [alias.name for alias in node.names]
                 import_name = f"from {module} import {', '.join(names)}"
@@ -85,10 +94,10 @@ class PythonParser(BaseParser):
                 )
                 nodes.append(import_node)
             
-            elif isinstance(node, ast.ClassDef):
+            elif cls is _ClassDef:
                 self._parse_class_flat(node, file_path, lines, nodes, parent_id)
             
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            elif cls is _FD or cls is _AFD:
                 func_node = self._create_function_node(node, file_path, lines, "function", parent_id)
                 nodes.append(func_node)
     
@@ -129,7 +138,7 @@ class PythonParser(BaseParser):
         loc = self._count_node_lines(lines, line_start, line_end)
         
         # Crear nodo de clase
-        class_node = CodeNode(
+        class_node = CodeNode.model_construct(
             id=class_id,
             parent_id=parent_id,
             name=node.name,
@@ -145,8 +154,10 @@ class PythonParser(BaseParser):
         nodes.append(class_node)
         
         # Agregar métodos de la clase
+        _FD, _AFD = ast.FunctionDef, ast.AsyncFunctionDef
         for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            cls = item.__class__
+            if cls is _FD or cls is _AFD:
                 method_node = self._create_method_node(item, file_path, lines, node.name, class_id)
                 nodes.append(method_node)
     
@@ -185,7 +196,7 @@ class PythonParser(BaseParser):
         # Detectar si es async
         is_async = isinstance(node, ast.AsyncFunctionDef)
         
-        return CodeNode(
+        return CodeNode.model_construct(
             id=f"{file_path}::{node.name}",
             parent_id=parent_id,
             name=node.name,
@@ -235,7 +246,7 @@ class PythonParser(BaseParser):
         # Detectar si es async
         is_async = isinstance(node, ast.AsyncFunctionDef)
         
-        return CodeNode(
+        return CodeNode.model_construct(
             id=f"{file_path}::{class_name}::{node.name}",
             parent_id=parent_id,
             name=node.name,
@@ -271,7 +282,7 @@ class PythonParser(BaseParser):
         Returns:
             CodeNode
         """
-        return CodeNode(
+        return CodeNode.model_construct(
             id=f"{file_path}::import::{name}",
             parent_id=parent_id,
             name=name,
@@ -284,13 +295,13 @@ class PythonParser(BaseParser):
         )
     
     def _get_decorator_name(self, decorator: ast.expr) -> str:
-        """Extrae el nombre de un decorador."""
+        """Extrae el nombre de un decorador (desenvolviendo llamadas @x(...))."""
+        while isinstance(decorator, ast.Call):
+            decorator = decorator.func
         if isinstance(decorator, ast.Name):
             return decorator.id
-        elif isinstance(decorator, ast.Attribute):
+        if isinstance(decorator, ast.Attribute):
             return self._get_attribute_name(decorator)
-        elif isinstance(decorator, ast.Call):
-            return self._get_decorator_name(decorator.func)
         return "unknown"
     
     def _get_attribute_name(self, node: ast.Attribute) -> str:
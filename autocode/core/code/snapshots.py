@@ -6,22 +6,53 @@ Proporciona:
 - Guardado de snapshots como JSON
 - Carga por commit hash, snapshot previo, historial
 - Listado de snapshots con resumen
+- Cache persistente de métricas por commit (inmutables por hash)
 """
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
+import lizard
+from pydantic import BaseModel
+
 from autocode.core.code.models import (
+    CommitMetrics,
     MetricsSnapshot,
     MetricsHistoryPoint,
 )
+from autocode.core.utils.fs import write_text_atomic
 
 logger = logging.getLogger(__name__)
 
 # Directorio de snapshots (relativo al CWD del proyecto host)
 METRICS_DIR = ".autocode/metrics"
 
+# Métricas before/after por commit, una por hash completo
+COMMIT_METRICS_DIR = ".autocode/metrics/commits"
+
+# Versión del formato de las métricas por commit. Subirla al cambiar el
+# esquema de CommitMetrics/FileMetrics, el cálculo del analizador o las
+# extensiones analizables. Junto con la versión de lizard forma el
+# subdirectorio de la caché, así que los resultados calculados con otro
+# analizador no se vuelven a servir.
+COMMIT_METRICS_VERSION = 1
+_COMMIT_METRICS_FORMAT = f"v{COMMIT_METRICS_VERSION}-lizard{lizard.version}"
+
+
+def _snapshot_files(dir_path: Path) -> list[Path]:
+    """Return the snapshot JSON files in dir_path, sorted by name.
+
+    Uses a single os.scandir pass instead of Path.glob pattern matching.
+    Dot-prefixed (hidden) names are skipped, as the "*.json" glob did.
+    """
+    with os.scandir(dir_path) as entries:
+        names = sorted(
+            e.name for e in entries
+            if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+        )
+    return [dir_path / name for name in names]
+
 
 def save_snapshot(snapshot: MetricsSnapshot, *, metrics_dir: str = METRICS_DIR) -> None:
     """Save snapshot as JSON in the metrics directory."""
@@ -29,8 +60,8 @@ def save_snapshot(snapshot: MetricsSnapshot, *, metrics_dir: str = METRICS_DIR)
     dir_path.mkdir(parents=True, exist_ok=True)
     fname = f"{snapshot.commit_short}.json"
     path = dir_path / fname
-    path.write_text(snapshot.model_dump_json(indent=2), encoding="utf-8")
-    logger.debug(f"Snapshot saved: {path}")
+    write_text_atomic(path, snapshot.model_dump_json(indent=2))
+    logger.debug("Snapshot saved: %s", path)
 
 
 def load_snapshot_by_hash(
@@ -40,11 +71,15 @@ def load_snapshot_by_hash(
     dir_path = Path(metrics_dir)
     if not dir_path.exists():
         return None
-    for f in dir_path.glob("*.json"):
+    for f in _snapshot_files(dir_path):
+        # Snapshots are saved as {commit_short}.json: skip files whose name
+        # can't belong to this commit instead of parsing every snapshot.
+        if not commit_hash.startswith(f.stem):
+            continue
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            if data.get("commit_hash") == commit_hash:
-                return MetricsSnapshot(**data)
+            snap = MetricsSnapshot.model_validate_json(f.read_bytes())
+            if snap.commit_hash == commit_hash:
+                return snap
         except Exception:
             continue
     return None
@@ -57,11 +92,10 @@ def load_previous_snapshot(
     dir_path = Path(metrics_dir)
     if not dir_path.exists():
         return None
-    files = sorted(dir_path.glob("*.json"), reverse=True)
+    files = _snapshot_files(dir_path)[::-1]
     for f in files:
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            snap = MetricsSnapshot(**data)
+            snap = MetricsSnapshot.model_validate_json(f.read_bytes())
             if snap.commit_hash != current_hash:
                 return snap
         except Exception:
@@ -77,35 +111,16 @@ def load_history_points(
     if not dir_path.exists():
         return []
 
+    root = dir_path.resolve()
+    files = _snapshot_files(root)
+    _prune_history_points(root, files)
+
     points: list[MetricsHistoryPoint] = []
-    for f in sorted(dir_path.glob("*.json")):
+    for f in files:
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            dist = data.get("complexity_distribution", {})
-            circular = data.get("circular_deps", [])
-            points.append(MetricsHistoryPoint(
-                commit_hash=data.get("commit_hash", ""),
-                commit_short=data.get("commit_short", ""),
-                branch=data.get("branch", ""),
-                timestamp=data.get("timestamp", ""),
-                total_sloc=data.get("total_sloc", 0),
-                total_files=data.get("total_files", 0),
-                total_functions=data.get("total_functions", 0),
-                total_classes=data.get("total_classes", 0),
-                total_comments=data.get("total_comments", 0),
-                total_blanks=data.get("total_blanks", 0),
-                avg_complexity=data.get("avg_complexity", 0.0),
-                avg_mi=data.get("avg_mi", 0.0),
-                rank_a=dist.get("A", 0),
-                rank_b=dist.get("B", 0),
-                rank_c=dist.get("C", 0),
-                rank_d=dist.get("D", 0),
-                rank_e=dist.get("E", 0),
-                rank_f=dist.get("F", 0),
-                circular_deps_count=len(circular),
-            ))
+            points.append(_load_history_point(f))
         except Exception as e:
-            logger.debug(f"Skip snapshot {f.name}: {e}")
+            logger.debug("Skip snapshot %s: %s", f.name, e)
             continue
 
     # Sort by timestamp (oldest first) and limit
@@ -113,25 +128,140 @@ def load_history_points(
     return points[-max_count:] if len(points) > max_count else points
 
 
+class _SnapshotSummary(BaseModel):
+    """Aggregate fields of a snapshot file, without the per-file metrics.
+
+    Validating JSON straight into this model skips the large ``files`` and
+    ``coupling`` arrays instead of materializing them as Python dicts.
+    """
+
+    commit_hash: str = ""
+    commit_short: str = ""
+    branch: str = ""
+    timestamp: str = ""
+    total_sloc: int = 0
+    total_files: int = 0
+    total_functions: int = 0
+    total_classes: int = 0
+    total_comments: int = 0
+    total_blanks: int = 0
+    avg_complexity: float = 0.0
+    avg_mi: float = 0.0
+    complexity_distribution: dict[str, int] = {}
+    circular_deps: list = []
+
+
+# Snapshot files are written once per commit, so the history point extracted
+# from each one is cached by absolute path and invalidated when its
+# (mtime_ns, size) changes. Entries of deleted snapshots are pruned on listing.
+_HISTORY_POINT_CACHE: dict[str, tuple[tuple[int, int], MetricsHistoryPoint]] = {}
+
+
+def _prune_history_points(root: Path, files: list[Path]) -> None:
+    """Drop cached points of snapshots in root that are no longer listed."""
+    prefix = str(root)
+    live = {str(f) for f in files}
+    stale = [
+        key for key in _HISTORY_POINT_CACHE
+        if os.path.dirname(key) == prefix and key not in live
+    ]
+    for key in stale:
+        del _HISTORY_POINT_CACHE[key]
+
+
+def _load_history_point(f: Path) -> MetricsHistoryPoint:
+    """Return the history point for a snapshot file, parsing it only if it changed.
+
+    f must be absolute: its string form is the cache key.
+    """
+    key = str(f)
+    st = f.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _HISTORY_POINT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    data = _SnapshotSummary.model_validate_json(f.read_bytes())
+    dist = data.complexity_distribution
+    point = MetricsHistoryPoint(
+        commit_hash=data.commit_hash,
+        commit_short=data.commit_short,
+        branch=data.branch,
+        timestamp=data.timestamp,
+        total_sloc=data.total_sloc,
+        total_files=data.total_files,
+        total_functions=data.total_functions,
+        total_classes=data.total_classes,
+        total_comments=data.total_comments,
+        total_blanks=data.total_blanks,
+        avg_complexity=data.avg_complexity,
+        avg_mi=data.avg_mi,
+        rank_a=dist.get("A", 0),
+        rank_b=dist.get("B", 0),
+        rank_c=dist.get("C", 0),
+        rank_d=dist.get("D", 0),
+        rank_e=dist.get("E", 0),
+        rank_f=dist.get("F", 0),
+        circular_deps_count=len(data.circular_deps),
+    )
+    _HISTORY_POINT_CACHE[key] = (stamp, point)
+    return point
+
+
 def list_snapshots(*, metrics_dir: str = METRICS_DIR) -> list[dict]:
     """List all saved snapshots with summary info."""
     dir_path = Path(metrics_dir)
     if not dir_path.exists():
         return []
     result = []
-    for f in sorted(dir_path.glob("*.json"), reverse=True):
+    for f in reversed(_snapshot_files(dir_path)):
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
+            data = _SnapshotSummary.model_validate_json(f.read_bytes())
             result.append({
                 "filename": f.name,
-                "commit_short": data.get("commit_short", ""),
-                "branch": data.get("branch", ""),
-                "timestamp": data.get("timestamp", ""),
-                "total_files": data.get("total_files", 0),
-                "total_sloc": data.get("total_sloc", 0),
-                "avg_complexity": data.get("avg_complexity", 0),
-                "avg_mi": data.get("avg_mi", 0),
+                "commit_short": data.commit_short,
+                "branch": data.branch,
+                "timestamp": data.timestamp,
+                "total_files": data.total_files,
+                "total_sloc": data.total_sloc,
+                "avg_complexity": data.avg_complexity,
+                "avg_mi": data.avg_mi,
             })
         except Exception:
             continue
     return result
+
+
+def save_commit_metrics(
+    metrics: CommitMetrics, *, metrics_dir: str = COMMIT_METRICS_DIR
+) -> None:
+    """Persist the metrics of a commit, keyed by its full hash and metrics format."""
+    path = _commit_metrics_path(metrics_dir, metrics.commit_hash)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(path, metrics.model_dump_json())
+    logger.debug("Commit metrics saved: %s", path)
+
+
+def load_commit_metrics(
+    commit_hash: str, *, metrics_dir: str = COMMIT_METRICS_DIR
+) -> Optional[CommitMetrics]:
+    """Load previously computed metrics for a full commit hash, if any.
+
+    A commit's content never changes, so its before/after metrics only go
+    stale when the way they are computed does; results are stored under a
+    format directory (COMMIT_METRICS_VERSION + lizard version) and metrics
+    saved by another format are not found.
+    """
+    path = _commit_metrics_path(metrics_dir, commit_hash)
+    try:
+        return CommitMetrics.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable commit metrics %s: %s", path.name, e)
+        return None
+
+
+def _commit_metrics_path(metrics_dir: str, commit_hash: str) -> Path:
+    """Path of a commit's cached metrics for the current metrics format."""
+    return Path(metrics_dir) / _COMMIT_METRICS_FORMAT / f"{commit_hash}.json"
@@ -6,6 +6,7 @@ Construye un grafo plano (adjacency list) para evitar recursión en OpenAPI sche
 Usa get_git_tree() para obtener solo archivos trackeados por git.
 """
 
+import os
 from pathlib import Path
 from typing import List, Optional, Dict
 
@@ -13,10 +14,11 @@ from fastapi import HTTPException
 from refract import register_function
 from autocode.core.vcs import get_git_tree
 from .models import CodeNode, CodeGraph, CodeStructureResult, CodeSummaryResult
+from .parsers import get_parser
 
 
 # Extensiones parseables
-PARSEABLE_EXTENSIONS = {'.py', '.js', '.mjs', '.jsx'}
+PARSEABLE_EXTENSIONS = frozenset({'.py', '.js', '.mjs', '.jsx'})
 
 
 @register_function(http_methods=["GET"], interfaces=["api"])
@@ -54,9 +56,8 @@ def get_code_structure(
             if node.type != 'file':
                 continue
             
-            # Verificar extensión
-            file_path = Path(node.path)
-            if file_path.suffix not in PARSEABLE_EXTENSIONS:
+            # Verificar extensión (sobre el string, sin construir un Path por nodo)
+            if os.path.splitext(node.path)[1] not in PARSEABLE_EXTENSIONS:
                 continue
             
             # Verificar que está dentro del path solicitado (si no es root)
@@ -199,15 +200,18 @@ def _render_summary_tree(
             _render_summary_tree(child.id, children_map, node_map, lines, prefix + extension)
         
         elif child.type == "file":
-            # Contar clases y funciones/métodos dentro del archivo
-            file_children = children_map.get(child.id, [])
-            n_classes = sum(1 for c in file_children if c.type == "class")
-            n_funcs = sum(1 for c in file_children if c.type in ("function", "method"))
-            # Contar métodos dentro de clases de este archivo
-            for fc in file_children:
-                if fc.type == "class":
-                    class_children = children_map.get(fc.id, [])
-                    n_funcs += sum(1 for cc in class_children if cc.type == "method")
+            # Contar clases y funciones/métodos (incluidos los de sus clases)
+            # en una sola pasada sobre los hijos del archivo
+            n_classes = n_funcs = 0
+            for fc in children_map.get(child.id, ()):
+                fc_type = fc.type
+                if fc_type == "class":
+                    n_classes += 1
+                    for cc in children_map.get(fc.id, ()):
+                        if cc.type == "method":
+                            n_funcs += 1
+                elif fc_type == "function" or fc_type == "method":
+                    n_funcs += 1
             
             # Formato compacto: nombre - LOC, conteos
             parts = [f"{child.loc} LOC"]
@@ -393,8 +397,6 @@ def _add_file_nodes(
     Returns:
         LOC del archivo
     """
-    from .parsers import get_parser
-    
     path_str = str(path)
     parser = get_parser(path.suffix)
     
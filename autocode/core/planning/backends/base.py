@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from autocode.core.planning.models import ExecutionStep
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """Resultado de ejecutar un plan via un backend."""
 
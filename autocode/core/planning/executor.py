@@ -465,12 +465,15 @@ async def _run_review_flow(
     )
 
     # 2. Run review
+    # Review and commit are blocking (git subprocesses, LLM calls): run them
+    # in a worker thread so the event loop keeps serving other streams.
     review_result = None
     commit_hash = ""
 
     if review_mode == "auto":
         try:
-            review_result = auto_review(
+            review_result = await asyncio.to_thread(
+                auto_review,
                 files_changed,
                 parent_commit=plan.parent_commit or "HEAD",
             )
@@ -485,7 +488,8 @@ async def _run_review_flow(
     else:
         # Human mode: compute metrics only, no verdict
         try:
-            file_metrics = compute_review_metrics(
+            file_metrics = await asyncio.to_thread(
+                compute_review_metrics,
                 files_changed,
                 parent_commit=plan.parent_commit or "HEAD",
             )
@@ -519,7 +523,9 @@ async def _run_review_flow(
         # Auto-approved → commit and mark completed
         if files_changed:
             try:
-                commit_hash = git_add_and_commit(files_changed, plan.title)
+                commit_hash = await asyncio.to_thread(
+                    git_add_and_commit, files_changed, plan.title
+                )
                 plan.execution.commit_hash = commit_hash
             except Exception as e:
                 logger.error(f"Auto-commit failed: {e}")
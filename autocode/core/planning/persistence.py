@@ -8,35 +8,43 @@ Extraído de planner.py para separación de responsabilidades.
 """
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
 from autocode.core.planning.models import CommitPlan, CommitPlanSummary
+from autocode.core.utils.fs import write_text_atomic
 
 logger = logging.getLogger(__name__)
 
 # Directorio de planes (relativo al CWD del proyecto host)
 PLANS_DIR = ".autocode/plans"
 
+# Resúmenes ya parseados: ruta absoluta → ((mtime_ns, size), summary).
+# save_plan/delete_plan invalidan su entrada; los cambios externos se
+# detectan por el stat del archivo.
+_SUMMARY_CACHE: dict[str, tuple[tuple[int, int], CommitPlanSummary]] = {}
+
 
 def save_plan(plan: CommitPlan, plans_dir: Optional[str] = None) -> None:
     """Save plan as JSON in .autocode/plans/."""
     dir_path = Path(plans_dir if plans_dir is not None else PLANS_DIR)
     dir_path.mkdir(parents=True, exist_ok=True)
     path = dir_path / f"{plan.id}.json"
-    path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
-    logger.debug(f"Plan saved: {path}")
+    if write_text_atomic(path, plan.model_dump_json(indent=2)):
+        _SUMMARY_CACHE.pop(os.path.abspath(path), None)
+        logger.debug("Plan saved: %s", path)
 
 
 def load_plan(plan_id: str, plans_dir: Optional[str] = None) -> Optional[CommitPlan]:
     """Load a plan by ID. Returns None if not found."""
     dir_path = Path(plans_dir if plans_dir is not None else PLANS_DIR)
     plan_file = dir_path / f"{plan_id}.json"
-    if not plan_file.exists():
-        return None
     try:
-        data = json.loads(plan_file.read_text(encoding="utf-8"))
-        return CommitPlan(**data)
+        # Una sola lectura y un solo parse: pydantic valida el JSON directamente
+        return CommitPlan.model_validate_json(plan_file.read_bytes())
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Error loading plan {plan_id}: {e}")
         return None
@@ -48,27 +56,50 @@ def list_plan_summaries(status_filter: str = "", plans_dir: Optional[str] = None
     if not dir_path.exists():
         return []
 
+    # Un único scandir: los DirEntry traen nombre y tipo sin stat extra.
+    with os.scandir(dir_path) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".json") and not e.name.startswith(".")
+        ]
+    entries.sort(key=lambda e: e.name, reverse=True)
+
     summaries = []
-    for f in sorted(dir_path.glob("*.json"), reverse=True):
+    for entry in entries:
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            plan_status = data.get("status", "draft")
-            if status_filter and plan_status != status_filter:
-                continue
-            summaries.append(CommitPlanSummary(
-                id=data.get("id", f.stem),
-                title=data.get("title", ""),
-                status=plan_status,
-                created_at=data.get("created_at", ""),
-                branch=data.get("branch", ""),
-            ))
+            summary = _load_summary(entry)
         except Exception as e:
-            logger.debug(f"Skip plan {f.name}: {e}")
+            logger.debug("Skip plan %s: %s", entry.name, e)
             continue
+        if status_filter and summary.status != status_filter:
+            continue
+        summaries.append(summary)
 
     return summaries
 
 
+def _load_summary(entry: os.DirEntry) -> CommitPlanSummary:
+    """Devuelve el resumen de un plan, parseándolo solo si el archivo cambió."""
+    key = os.path.abspath(entry.path)
+    st = entry.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _SUMMARY_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(entry.path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    summary = CommitPlanSummary(
+        id=data.get("id", entry.name[:-len(".json")]),
+        title=data.get("title", ""),
+        status=data.get("status", "draft"),
+        created_at=data.get("created_at", ""),
+        branch=data.get("branch", ""),
+    )
+    _SUMMARY_CACHE[key] = (stamp, summary)
+    return summary
+
+
 def delete_plan(plan_id: str, plans_dir: Optional[str] = None) -> bool:
     """Delete a plan by ID. Returns True if deleted, False if not found."""
     dir_path = Path(plans_dir if plans_dir is not None else PLANS_DIR)
@@ -76,5 +107,6 @@ def delete_plan(plan_id: str, plans_dir: Optional[str] = None) -> bool:
     if not plan_file.exists():
         return False
     plan_file.unlink()
-    logger.debug(f"Plan deleted: {plan_file}")
+    _SUMMARY_CACHE.pop(os.path.abspath(plan_file), None)
+    logger.debug("Plan deleted: %s", plan_file)
     return True
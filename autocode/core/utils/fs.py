@@ -0,0 +1,49 @@
+"""
+fs.py
+Filesystem helpers shared by the persistence layers (plans, metrics).
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str) -> bool:
+    """Write text to path atomically, skipping the write if nothing changed.
+
+    The content goes to a uniquely named sibling temp file that is then
+    renamed over the target with os.replace, so readers never see a
+    half-written file and concurrent writers don't share a temp path.
+    Rewriting identical bytes is skipped, which also keeps the file's mtime
+    stable for the (mtime, size)-keyed read caches.
+
+    Args:
+        path: Destination file.
+        text: Content to write (encoded as UTF-8).
+
+    Returns:
+        True if the file was written, False if it already had this content.
+    """
+    data = text.encode("utf-8")
+    try:
+        st = path.stat()
+        if st.st_size == len(data) and path.read_bytes() == data:
+            return False
+        mode = st.st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        # mkstemp creates 0600; keep the target's permissions instead
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return True
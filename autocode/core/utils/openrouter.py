@@ -1,15 +1,47 @@
 """
 Utilities for interacting with OpenRouter API.
 """
+import atexit
 import os
 import logging
+import threading
 import httpx
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1"
 
+# Shared sync client, created on first use: keeps the connection pool (and TLS
+# session) warm across calls instead of reconnecting on every request.
+_client: Optional[httpx.Client] = None
+# Lookups run from server worker threads: only one of them may create the client
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared httpx client, creating it on first use."""
+    global _client
+    client = _client
+    if client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client()
+            client = _client
+    return client
+
+
+def close_client() -> None:
+    """Close the shared httpx client, if any; the next call creates a new one."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_client)
+
 def get_openrouter_api_key() -> Optional[str]:
     """Get OpenRouter API key from environment."""
     return os.getenv("OPENROUTER_API_KEY")
@@ -33,36 +65,34 @@ def fetch_openrouter_model_info(model_id: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        # Use sync Client
-        with httpx.Client() as client:
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "HTTP-Referer": "https://github.com/brunvelop/autocode", # Recommended by OpenRouter
-            }
-            response = client.get(f"{OPENROUTER_API_URL}/models", headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            models_list = data.get("data", [])
-            
-            # Find the specific model
-            for model in models_list:
-                if model.get("id") == model_id:
-                    return model
-            
-            logger.warning(f"Model {model_id} not found in OpenRouter list.")
-            return None
-            
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": "https://github.com/brunvelop/autocode", # Recommended by OpenRouter
+        }
+        response = _get_client().get(f"{OPENROUTER_API_URL}/models", headers=headers)
+        response.raise_for_status()
+        
+        data = response.json()
+        models_list = data.get("data", [])
+        
+        # Find the specific model
+        for model in models_list:
+            if model.get("id") == model_id:
+                return model
+        
+        logger.warning(f"Model {model_id} not found in OpenRouter list.")
+        return None
+        
     except Exception as e:
         logger.error(f"Error fetching OpenRouter model info: {e}")
         return None
 
-def fetch_models_info(model_ids: List[str]) -> Dict[str, Any]:
+def fetch_models_info(model_ids: Sequence[str]) -> Dict[str, Any]:
     """
     Fetch metadata for a list of models efficiently.
     
     Args:
-        model_ids: List of model IDs to look up
+        model_ids: Sequence of model IDs to look up
         
     Returns:
         Dict mapping model_id to its metadata.
@@ -72,36 +102,34 @@ def fetch_models_info(model_ids: List[str]) -> Dict[str, Any]:
         return {}
 
     try:
-        # Use sync Client
-        with httpx.Client() as client:
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "HTTP-Referer": "https://github.com/brunvelop/autocode",
-            }
-            # We fetch the full list once
-            response = client.get(f"{OPENROUTER_API_URL}/models", headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            all_models = data.get("data", [])
-            
-            result = {}
-            # Index all models by ID for faster lookup
-            models_map = {m.get("id"): m for m in all_models}
-            
-            for mid in model_ids:
-                # Try exact match
-                if mid in models_map:
-                    result[mid] = models_map[mid]
-                    continue
-                
-                # Try stripping 'openrouter/' prefix (common in this project)
-                clean_id = mid.replace('openrouter/', '')
-                if clean_id in models_map:
-                    result[mid] = models_map[clean_id]
-            
-            return result
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": "https://github.com/brunvelop/autocode",
+        }
+        # We fetch the full list once
+        response = _get_client().get(f"{OPENROUTER_API_URL}/models", headers=headers)
+        response.raise_for_status()
+        
+        data = response.json()
+        all_models = data.get("data", [])
+        
+        result = {}
+        # Index all models by ID for faster lookup
+        models_map = {m.get("id"): m for m in all_models}
+        
+        for mid in model_ids:
+            # Try exact match
+            if mid in models_map:
+                result[mid] = models_map[mid]
+                continue
             
+            # Try stripping 'openrouter/' prefix (common in this project)
+            clean_id = mid.replace('openrouter/', '')
+            if clean_id in models_map:
+                result[mid] = models_map[clean_id]
+        
+        return result
+        
     except Exception as e:
         logger.error(f"Error fetching OpenRouter models: {e}")
         return {}
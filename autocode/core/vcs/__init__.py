@@ -38,7 +38,7 @@ from autocode.core.vcs.status import (
     get_git_status_summary,
 )
 from autocode.core.vcs.log import get_git_log, get_git_log_summary, get_commit_detail
-from autocode.core.vcs.git import git, git_checked, git_show, git_add_and_commit, get_tracked_files, get_tracked_files_at_commit
+from autocode.core.vcs.git import git, git_checked, git_show, git_show_batch, git_add_and_commit, get_tracked_files, get_tracked_files_at_commit
 from autocode.core.vcs.execution import (
     ExecutionSandbox,
     async_rev_parse_head,
@@ -76,6 +76,7 @@ __all__ = [
     "git",
     "git_checked",
     "git_show",
+    "git_show_batch",
     "git_add_and_commit",
     "get_tracked_files",
     "get_tracked_files_at_commit",
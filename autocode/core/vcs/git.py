@@ -8,9 +8,9 @@ Extracted from duplicated _git() helpers in metrics.py, planner.py,
 executor.py, and reviewer.py.
 """
 
+import os
 import subprocess
-from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 def git(*args: str, cwd: str = ".") -> str:
@@ -24,7 +24,7 @@ def git(*args: str, cwd: str = ".") -> str:
         Stripped stdout string, empty on failure.
     """
     result = subprocess.run(
-        ["git"] + list(args),
+        ["git", *args],
         capture_output=True, text=True, check=False, cwd=cwd,
     )
     return result.stdout.strip()
@@ -46,7 +46,7 @@ def git_checked(*args: str, cwd: str = ".") -> str:
         RuntimeError: If git exits with non-zero code.
     """
     result = subprocess.run(
-        ["git"] + list(args),
+        ["git", *args],
         capture_output=True, text=True, check=False, cwd=cwd,
     )
     if result.returncode != 0:
@@ -76,6 +76,57 @@ def git_show(ref: str, cwd: str = ".") -> Optional[str]:
     return result.stdout
 
 
+def git_show_batch(refs: List[str], cwd: str = ".") -> Dict[str, Optional[str]]:
+    """Get the content of many git refs with a single git process.
+
+    Feeds all refs to one `git cat-file --batch` instead of spawning a
+    `git show` per file, which dominates when reading a whole tree.
+
+    Args:
+        refs: Git refs (e.g., ["HEAD:a.py", "HEAD:b.py"])
+        cwd: Working directory for the git command (default: ".")
+
+    Returns:
+        Dict mapping each ref to its content string, or None if the ref
+        could not be resolved.
+    """
+    contents: Dict[str, Optional[str]] = dict.fromkeys(refs)
+    if not refs:
+        return contents
+
+    result = subprocess.run(
+        ["git", "cat-file", "--batch=%(objectname) %(objecttype) %(objectsize)"],
+        input="".join(f"{ref}\n" for ref in refs).encode("utf-8"),
+        capture_output=True, check=False, cwd=cwd,
+    )
+    if result.returncode != 0:
+        return contents
+
+    # Each answer is "<oid> <type> <size>\n<content>\n", or a single
+    # "<ref> missing\n" / "<ref> ambiguous\n" line. The ref may itself
+    # contain spaces, so unresolved refs are detected by their last token.
+    out = result.stdout
+    pos = 0
+    for ref in refs:
+        end = out.find(b"\n", pos)
+        if end == -1:
+            break
+        header = out[pos:end]
+        pos = end + 1
+        if header.endswith((b" missing", b" ambiguous")):
+            continue
+        size = int(header.rsplit(b" ", 1)[1])
+        try:
+            # Strict decoding, like git_show: undecodable content is None.
+            # Newlines are translated like git_show's text=True output.
+            text = out[pos:pos + size].decode("utf-8")
+            contents[ref] = text.replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError:
+            pass
+        pos += size + 1
+    return contents
+
+
 def git_add_and_commit(
     files: List[str], message: str, cwd: str = "."
 ) -> str:
@@ -130,7 +181,7 @@ def get_tracked_files_at_commit(
         return []
 
     ext_set = set(extensions)
-    return [f for f in output.split("\n") if f and Path(f).suffix in ext_set]
+    return [f for f in output.split("\n") if f and os.path.splitext(f)[1] in ext_set]
 
 
 def get_tracked_files(*extensions: str, cwd: str = ".") -> List[str]:
@@ -156,9 +207,10 @@ def get_tracked_files(*extensions: str, cwd: str = ".") -> List[str]:
     if not output:
         return []
 
-    # Filter to ensure exact extension match (git glob may be broader)
+    # Filter to ensure exact extension match (git glob may be broader).
+    # splitext on the raw string avoids building a Path per tracked file.
     ext_set = set(extensions)
     return [
         f for f in output.split("\n")
-        if f and Path(f).suffix in ext_set
+        if f and os.path.splitext(f)[1] in ext_set
     ]
@@ -6,6 +6,7 @@ el grafo de commits, ramas, tags y detalles de commits individuales.
 """
 import subprocess
 import logging
+import sys
 from typing import Optional
 
 from fastapi import HTTPException
@@ -242,7 +243,12 @@ def _get_commits(max_count: int, branch: str) -> list[GitCommit]:
             continue
 
         full_hash, short_hash, author, email, date, parents_str, subject = parts
-        parents = parents_str.split() if parents_str else []
+        # Autores y hashes se repiten entre commits (un padre es el hash de
+        # otro commit): internarlos comparte un único objeto str por valor.
+        full_hash = sys.intern(full_hash)
+        author = sys.intern(author)
+        email = sys.intern(email)
+        parents = [sys.intern(p) for p in parents_str.split()] if parents_str else []
 
         commits.append(
             GitCommit(
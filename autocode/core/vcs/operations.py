@@ -85,7 +85,7 @@ class GitOperations:
             content = self.repo.git.show(f"{branch}:{file_path}")
             return content
         except Exception as e:
-            logger.debug(f"No se pudo leer {file_path} de {branch}: {e}")
+            logger.debug("No se pudo leer %s de %s: %s", file_path, branch, e)
             return None
     
     # ========================================================================
@@ -133,7 +133,7 @@ class GitOperations:
         """Agrega archivos/directorios al staging area."""
         try:
             self.repo.index.add(paths)
-            logger.debug(f"Agregados al staging: {paths}")
+            logger.debug("Agregados al staging: %s", paths)
         except Exception as e:
             logger.error(f"Error agregando paths: {e}")
             raise GitCommandError("Error en git add", 128) from e
@@ -194,6 +194,6 @@ class GitOperations:
             for path in paths:
                 subprocess.run(["git", "reset", mode, path], check=False, capture_output=True)
                 subprocess.run(["git", "checkout", mode, path], check=False, capture_output=True)
-            logger.debug(f"Paths reseteados: {paths}")
+            logger.debug("Paths reseteados: %s", paths)
         except Exception as e:
             logger.warning(f"Error reseteando paths: {e}")
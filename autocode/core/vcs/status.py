@@ -350,6 +350,6 @@ def _add_line_stats(files: List[GitFileStatus]) -> List[GitFileStatus]:
                     f.additions, f.deletions = stats[f.path]
     
     except Exception as e:
-        logger.debug(f"Error obteniendo line stats: {e}")
+        logger.debug("Error obteniendo line stats: %s", e)
     
     return files
@@ -17,12 +17,14 @@ Configuration (consumer's pyproject.toml):
 How it works:
     - Registers --autocode-health CLI flag
     - Registers 'health' marker
-    - Provides session-scoped fixtures: health_config, all_file_metrics, coupling_result
+    - Provides session-scoped fixtures: health_config, autocode_tracked_files,
+      all_file_metrics, coupling_result
     - When --autocode-health is active: collects built-in gate tests from gates.py
     - Prints a summary table at the end of the run (only when --autocode-health active)
 """
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +41,9 @@ _ALL_EXTENSIONS = (".py", ".js", ".mjs", ".jsx")
 # Almacén de datos para el hook terminal (poblado por los fixtures del plugin)
 _plugin_health_summary: dict = {}
 
+# Por debajo de este número de archivos, arrancar procesos no compensa
+_PARALLEL_MIN_FILES = 64
+
 
 # ==============================================================================
 # OPTION + MARKER REGISTRATION
@@ -124,10 +129,29 @@ def health_config(request) -> HealthConfig:
 
 
 @pytest.fixture(scope="session")
-def all_file_metrics(health_config: HealthConfig) -> list[FileMetrics]:
-    """Analiza TODOS los archivos trackeados por git una sola vez por sesión.
+def autocode_tracked_files(health_config: HealthConfig) -> list[str]:
+    """Lista los archivos trackeados por git una sola vez por sesión.
 
     Excluye los archivos que coincidan con los globs en health_config.exclude.
+    Compartido por all_file_metrics y coupling_result para no repetir
+    git ls-files ni el filtrado de globs.
+
+    Returns:
+        Lista de paths relativos de los archivos a analizar.
+    """
+    files = get_tracked_files(*_ALL_EXTENSIONS)
+    return [
+        f for f in files
+        if not any(Path(f).match(p) for p in health_config.exclude)
+    ]
+
+
+@pytest.fixture(scope="session")
+def all_file_metrics(
+    health_config: HealthConfig, autocode_tracked_files: list[str]
+) -> list[FileMetrics]:
+    """Analiza TODOS los archivos trackeados por git una sola vez por sesión.
+
     Popula el summary interno del plugin para el hook terminal.
 
     Returns:
@@ -135,18 +159,8 @@ def all_file_metrics(health_config: HealthConfig) -> list[FileMetrics]:
     """
     global _plugin_health_summary
 
-    files = get_tracked_files(*_ALL_EXTENSIONS)
-    results: list[FileMetrics] = []
-
-    for fpath in files:
-        if any(Path(fpath).match(pattern) for pattern in health_config.exclude):
-            continue
-        try:
-            content = Path(fpath).read_text(encoding="utf-8")
-            fm = analyze_file_metrics(fpath, content)
-            results.append(fm)
-        except Exception:
-            pass
+    analyzed = _analyze_paths(autocode_tracked_files, health_config.parallel_workers)
+    results = [fm for fm in analyzed if fm is not None]
 
     # Calcular agregados para el resumen terminal
     if results:
@@ -167,9 +181,33 @@ def all_file_metrics(health_config: HealthConfig) -> list[FileMetrics]:
     return results
 
 
+def _analyze_paths(paths: list[str], workers: int) -> list[Optional[FileMetrics]]:
+    """Analiza los archivos en serie, o en procesos si el consumidor lo activa.
+
+    El análisis (AST + lizard) es CPU-bound, pero el plugin corre dentro del
+    pytest del consumidor: solo se reparte entre procesos con
+    parallel_workers > 1 en [tool.codehealth] y suficientes archivos.
+    map conserva el orden de entrada.
+    """
+    if workers > 1 and len(paths) >= _PARALLEL_MIN_FILES:
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_analyze_path, paths, chunksize=chunksize))
+    return [_analyze_path(fpath) for fpath in paths]
+
+
+def _analyze_path(fpath: str) -> Optional[FileMetrics]:
+    """Lee y analiza un archivo. Devuelve None si no se puede leer o analizar."""
+    try:
+        content = Path(fpath).read_text(encoding="utf-8")
+        return analyze_file_metrics(fpath, content)
+    except Exception:
+        return None
+
+
 @pytest.fixture(scope="session")
 def coupling_result(
-    health_config: HealthConfig,
+    health_config: HealthConfig, autocode_tracked_files: list[str]
 ) -> tuple[list[PackageCoupling], list[list[str]]]:
     """Analiza el acoplamiento entre paquetes una sola vez por sesión.
 
@@ -180,12 +218,7 @@ def coupling_result(
     """
     global _plugin_health_summary
 
-    files = get_tracked_files(*_ALL_EXTENSIONS)
-    filtered = [
-        f for f in files
-        if not any(Path(f).match(p) for p in health_config.exclude)
-    ]
-    coupling, circulars = analyze_coupling(filtered)
+    coupling, circulars = analyze_coupling(autocode_tracked_files)
 
     circ_icon = "✅" if len(circulars) <= health_config.max_circular_deps else "❌"
     _plugin_health_summary["Circular deps"] = f"{len(circulars)} {circ_icon}"
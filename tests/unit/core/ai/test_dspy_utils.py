@@ -114,6 +114,34 @@ class TestPrepareChatTools:
         tools = prepare_chat_tools()
         assert tools == []
 
+    @patch('autocode.core.ai.dspy_utils.Refract')
+    def test_reuses_wrapper_for_same_function_info(self, mock_refract_cls):
+        """Repeated calls return the same wrapper while the FunctionInfo is unchanged."""
+        from autocode.core.ai.dspy_utils import prepare_chat_tools
+        from refract import FunctionInfo
+
+        mock_app = Mock()
+        mock_refract_cls.current.return_value = mock_app
+        func_info = FunctionInfo(
+            name="cached_tool", func=Mock(), description="Cached",
+            params=[], http_methods=["GET"], interfaces=["mcp"], return_type=ChatResult
+        )
+        mock_app.get_functions_for_interface.return_value = [func_info]
+
+        first = prepare_chat_tools()
+        second = prepare_chat_tools()
+        assert first[0] is second[0]
+
+        # Re-registering the function (new FunctionInfo) rebuilds the wrapper
+        replacement = FunctionInfo(
+            name="cached_tool", func=Mock(), description="Replaced",
+            params=[], http_methods=["GET"], interfaces=["mcp"], return_type=ChatResult
+        )
+        mock_app.get_functions_for_interface.return_value = [replacement]
+        third = prepare_chat_tools()
+        assert third[0] is not first[0]
+        assert "Replaced" in third[0].__doc__
+
 
 class TestCreateToolWrapper:
     """Tests for _create_tool_wrapper helper."""
@@ -443,6 +471,30 @@ class TestExtractSignatureOutputs:
         assert "response" not in result
 
 
+class TestGetTypeName:
+    """Tests for _get_type_name()."""
+
+    def test_empty_annotation_is_any(self):
+        """Missing annotations are reported as 'any'."""
+        import inspect
+        from autocode.core.ai.dspy_utils import _get_type_name
+
+        assert _get_type_name(inspect.Parameter.empty) == 'any'
+
+    def test_named_and_unnamed_types(self):
+        """Types with __name__ use it; others fall back to their str() form."""
+        from autocode.core.ai.dspy_utils import _get_type_name
+
+        assert _get_type_name(int) == 'int'
+        assert _get_type_name(int | None) == 'int | None'
+
+    def test_unhashable_annotation_falls_back(self):
+        """Unhashable annotations bypass the cache instead of raising."""
+        from autocode.core.ai.dspy_utils import _get_type_name
+
+        assert _get_type_name(['not', 'hashable']) == "['not', 'hashable']"
+
+
 class TestGetModuleKwargsSchema:
     """Tests for get_module_kwargs_schema()."""
 
@@ -501,6 +553,12 @@ class TestGetAllModuleKwargsSchemas:
             assert 'params' in schema, f"{module_type} missing 'params'"
             assert 'supports_tools' in schema, f"{module_type} missing 'supports_tools'"
 
+    def test_schemas_are_built_once(self):
+        """Repeated calls reuse the schemas built on the first call."""
+        from autocode.core.ai.dspy_utils import get_all_module_kwargs_schemas
+
+        assert get_all_module_kwargs_schemas() is get_all_module_kwargs_schemas()
+
 
 class TestGetAvailableToolsInfo:
     """Tests for get_available_tools_info()."""
@@ -541,6 +599,36 @@ class TestGetAvailableToolsInfo:
         assert result[0]['description'] == 'A tool'
         assert result[0]['enabled_by_default'] is True
 
+    def test_same_functions_reuse_result(self):
+        """A new list holding the same FunctionInfo objects reuses the result."""
+        from autocode.core.ai.dspy_utils import get_available_tools_info
+        from refract import FunctionInfo
+
+        func = FunctionInfo(
+            name="cached_tool", func=Mock(), description="C tool",
+            params=[], http_methods=["GET"], interfaces=["mcp"], return_type=ChatResult
+        )
+
+        first = get_available_tools_info([func])
+
+        assert get_available_tools_info([func]) is first
+
+    def test_reregistered_functions_rebuild_result(self):
+        """New FunctionInfo objects (re-registration) rebuild the list."""
+        from autocode.core.ai.dspy_utils import get_available_tools_info
+        from refract import FunctionInfo
+
+        def make(description):
+            return FunctionInfo(
+                name="tool", func=Mock(), description=description,
+                params=[], http_methods=["GET"], interfaces=["mcp"], return_type=ChatResult
+            )
+
+        get_available_tools_info([make("old")])
+        result = get_available_tools_info([make("new")])
+
+        assert result[0]['description'] == 'new'
+
 
 # ============================================================================
 # COVERAGE GAP TESTS — fill remaining uncovered branches
@@ -652,8 +740,9 @@ class TestGetModuleKwargsSchemaEdgeCases:
 
     def test_inspect_signature_failure_returns_empty_schema(self):
         """When inspect.signature raises, returns empty schema."""
-        from autocode.core.ai.dspy_utils import get_module_kwargs_schema
+        from autocode.core.ai.dspy_utils import get_module_kwargs_schema, _get_init_signature
 
+        _get_init_signature.cache_clear()
         with patch('autocode.core.ai.dspy_utils.inspect.signature',
                    side_effect=ValueError("Cannot inspect")):
             schema = get_module_kwargs_schema('Predict')
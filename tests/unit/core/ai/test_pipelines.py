@@ -566,3 +566,41 @@ class TestReadPathContent:
 
         assert "x = 1" in result
         assert "y = 2" in result
+
+    def test_directory_preserves_order_and_skips_binary(self, tmp_path):
+        """Files are joined in sorted walk order; undecodable files are skipped."""
+        from autocode.core.ai.pipelines import _read_path_content
+
+        (tmp_path / "b.py").write_text("second")
+        (tmp_path / "a.py").write_text("first")
+        (tmp_path / "c.bin").write_bytes(b"\xff\xfe\x00")
+
+        result = _read_path_content(str(tmp_path))
+
+        assert result == "first\nsecond"
+
+    def test_empty_directory_returns_empty_string(self, tmp_path):
+        """A directory without files returns an empty string."""
+        from autocode.core.ai.pipelines import _read_path_content
+
+        assert _read_path_content(str(tmp_path)) == ""
+
+    def test_directory_walk_matches_os_walk(self, tmp_path):
+        """Nested files come out in os.walk order; symlinked dirs are not followed."""
+        from autocode.core.ai.pipelines import _iter_dir_files
+
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "b.py").write_text("b")
+        (tmp_path / "pkg" / "a.py").write_text("a")
+        (tmp_path / "pkg" / "sub" / "c.py").write_text("c")
+        (tmp_path / "top.py").write_text("top")
+        (tmp_path / "link").symlink_to(tmp_path / "pkg", target_is_directory=True)
+
+        expected = [
+            os.path.join(root, name)
+            for root, _, files in os.walk(str(tmp_path))
+            for name in sorted(files)
+        ]
+
+        assert list(_iter_dir_files(str(tmp_path))) == expected
+        assert not any("link" in p for p in expected)
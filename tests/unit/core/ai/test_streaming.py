@@ -687,6 +687,16 @@ class TestSerializeValue:
         assert result == {"name": "test", "value": 42}
         assert "_private" not in result
 
+    def test_primitive_subclasses_are_returned_as_is(self):
+        from enum import Enum
+        from autocode.core.ai.streaming import _serialize_value
+
+        class Color(str, Enum):
+            RED = "red"
+
+        assert _serialize_value(Color.RED) is Color.RED
+        assert _serialize_value({"c": [Color.RED]}) == {"c": ["red"]}
+
 
 class TestSerializeComplexObject:
     """Tests for _serialize_complex_object() (private helper in streaming.py)."""
@@ -239,6 +239,28 @@ class TestResolveFileDependencies:
         assert deps[0].source == "pkg/good.py"
         assert deps[0].target == "pkg/bad.py"
 
+    def test_resolve_skips_parse_for_files_without_package_names(self):
+        """Files that never name a project package are not parsed; others still resolve."""
+        from autocode.core.code import architecture
+        from autocode.core.code.architecture import _resolve_file_dependencies
+
+        contents = {
+            "pkg/a.py": "import os\nwebsite = 'pkgs'\n",
+            "pkg/b.py": "if True: from pkg.a import website\n",
+        }
+
+        def patched_read(self, *args, **kwargs):
+            return contents.get(str(self), "")
+
+        real_parse = architecture.ast.parse
+        with patch.object(Path, "read_text", patched_read), \
+             patch.object(architecture.ast, "parse", side_effect=real_parse) as mock_parse:
+            deps, _ = _resolve_file_dependencies(list(contents.keys()))
+
+        parsed = [c.kwargs.get("filename") for c in mock_parse.call_args_list]
+        assert parsed == ["pkg/b.py"]
+        assert [(d.source, d.target) for d in deps] == [("pkg/b.py", "pkg/a.py")]
+
 
 class TestGetDependencyCycles:
     """Tests for the compact MCP dependency cycle endpoint."""
@@ -257,13 +257,13 @@ class TestArchitectureSnapshotWithJS:
 class TestGetArchitectureSnapshotHistorical:
     """Tests for get_architecture_snapshot(commit_hash=...) — historical mode."""
 
-    @patch("autocode.core.code.architecture.git_show")
+    @patch("autocode.core.code.architecture.git_show_batch")
     @patch("autocode.core.code.architecture.get_tracked_files_at_commit")
     @patch("autocode.core.code.architecture.get_tracked_files")
     @patch("autocode.core.code.architecture.git")
     @patch("autocode.core.code.architecture.analyze_file_metrics")
     def test_snapshot_with_commit_hash_uses_get_tracked_files_at_commit(
-        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show
+        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show_batch
     ):
         """commit_hash set → must call get_tracked_files_at_commit, NOT get_tracked_files."""
         from autocode.core.code.architecture import get_architecture_snapshot
@@ -274,7 +274,7 @@ class TestGetArchitectureSnapshotHistorical:
             ("log", "-1", "--format=%D", "abc123"): "HEAD -> main",
         }.get(args, "")
         mock_get_files_at.return_value = ["src/app.py"]
-        mock_git_show.return_value = "x = 1\n"
+        mock_git_show_batch.return_value = {"abc123:src/app.py": "x = 1\n"}
         mock_analyze.return_value = make_simple_file_metrics("src/app.py")
 
         snapshot = get_architecture_snapshot(commit_hash="abc123")
@@ -283,15 +283,15 @@ class TestGetArchitectureSnapshotHistorical:
         mock_get_files_at.assert_called_once()
         mock_get_files.assert_not_called()
 
-    @patch("autocode.core.code.architecture.git_show")
+    @patch("autocode.core.code.architecture.git_show_batch")
     @patch("autocode.core.code.architecture.get_tracked_files_at_commit")
     @patch("autocode.core.code.architecture.get_tracked_files")
     @patch("autocode.core.code.architecture.git")
     @patch("autocode.core.code.architecture.analyze_file_metrics")
-    def test_snapshot_with_commit_hash_uses_git_show_as_content_reader(
-        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show
+    def test_snapshot_with_commit_hash_reads_content_from_git_batch(
+        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show_batch
     ):
-        """commit_hash set → file content must come from git_show, NOT from disk."""
+        """commit_hash set → file content must come from git_show_batch, NOT from disk."""
         from autocode.core.code.architecture import get_architecture_snapshot
 
         mock_git.side_effect = lambda *args, **kwargs: {
@@ -300,7 +300,7 @@ class TestGetArchitectureSnapshotHistorical:
             ("log", "-1", "--format=%D", "abc123"): "HEAD -> main",
         }.get(args, "")
         mock_get_files_at.return_value = ["src/app.py"]
-        mock_git_show.return_value = "x = 1\n"
+        mock_git_show_batch.return_value = {"abc123:src/app.py": "x = 1\n"}
         mock_analyze.return_value = make_simple_file_metrics("src/app.py")
 
         with patch.object(Path, "read_text") as mock_read:
@@ -308,17 +308,17 @@ class TestGetArchitectureSnapshotHistorical:
             mock_read.assert_not_called()
 
         assert snapshot.root_id == "."
-        mock_git_show.assert_called()
-        call_args = mock_git_show.call_args_list
+        mock_git_show_batch.assert_called_once()
+        call_args = mock_git_show_batch.call_args_list
         assert any("abc123:src/app.py" in str(c) for c in call_args)
 
-    @patch("autocode.core.code.architecture.git_show")
+    @patch("autocode.core.code.architecture.git_show_batch")
     @patch("autocode.core.code.architecture.get_tracked_files_at_commit")
     @patch("autocode.core.code.architecture.get_tracked_files")
     @patch("autocode.core.code.architecture.git")
     @patch("autocode.core.code.architecture.analyze_file_metrics")
     def test_snapshot_with_commit_hash_returns_correct_commit_metadata(
-        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show
+        self, mock_analyze, mock_git, mock_get_files, mock_get_files_at, mock_git_show_batch
     ):
         """commit_hash set → result must carry the resolved hash and short hash."""
         from autocode.core.code.architecture import get_architecture_snapshot
@@ -329,7 +329,7 @@ class TestGetArchitectureSnapshotHistorical:
             ("log", "-1", "--format=%D", "abc123"): "HEAD -> main",
         }.get(args, "")
         mock_get_files_at.return_value = ["src/app.py"]
-        mock_git_show.return_value = "x = 1\n"
+        mock_git_show_batch.return_value = {"abc123:src/app.py": "x = 1\n"}
         mock_analyze.return_value = make_simple_file_metrics("src/app.py")
 
         snapshot = get_architecture_snapshot(commit_hash="abc123")
@@ -337,7 +337,7 @@ class TestGetArchitectureSnapshotHistorical:
         assert snapshot.commit_hash == "abc123def456789"
         assert snapshot.commit_short == "abc123d"
 
-    @patch("autocode.core.code.architecture.git_show")
+    @patch("autocode.core.code.architecture.git_show_batch")
     @patch("autocode.core.code.architecture.get_tracked_files_at_commit")
     @patch("autocode.core.code.architecture.get_tracked_files")
     @patch("autocode.core.code.architecture.git")
@@ -345,7 +345,7 @@ class TestGetArchitectureSnapshotHistorical:
     @patch("pathlib.Path.read_text")
     def test_snapshot_without_commit_hash_unchanged(
         self, mock_read, mock_analyze, mock_git,
-        mock_get_files, mock_get_files_at, mock_git_show
+        mock_get_files, mock_get_files_at, mock_git_show_batch
     ):
         """commit_hash='' → existing behavior: get_tracked_files + disk reads."""
         from autocode.core.code.architecture import get_architecture_snapshot
@@ -364,4 +364,4 @@ class TestGetArchitectureSnapshotHistorical:
         assert snapshot.root_id == "."
         mock_get_files.assert_called_once()
         mock_get_files_at.assert_not_called()
-        mock_git_show.assert_not_called()
+        mock_git_show_batch.assert_not_called()
@@ -0,0 +1,26 @@
+"""Shared fixtures for code analysis tests."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_code_caches():
+    """Clear the module-level analysis caches before and after each test.
+
+    The analyzer, health, history-point and parser caches outlive a test, so
+    without this a test could be served results computed by an earlier one.
+    """
+    from autocode.core.code import analyzer, health, snapshots
+    from autocode.core.code.parsers import base
+
+    caches = (
+        analyzer._FILE_METRICS_CACHE,
+        health._HEALTH_METRICS_CACHE,
+        health._THRESHOLDS_CACHE,
+        snapshots._HISTORY_POINT_CACHE,
+        base._FLAT_NODES_CACHE,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
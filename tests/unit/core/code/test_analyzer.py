@@ -555,3 +555,123 @@ class TestClassInfoPopulation:
 
         assert fm.classes_count == 2
         assert len(fm.classes) == 2
+
+    def test_python_source_is_parsed_once(self):
+        """classes_count reuses the class-range parse instead of re-parsing."""
+        import ast
+        from unittest.mock import patch
+        from autocode.core.code.analyzer import analyze_file_metrics
+
+        code = "class A:\n    class Inner:\n        pass\n"
+        with patch("autocode.core.code.analyzer.ast.parse", wraps=ast.parse) as mock_parse:
+            fm = analyze_file_metrics("nested.py", code)
+
+        assert mock_parse.call_count == 1
+        assert fm.classes_count == 2
+
+
+# ==============================================================================
+# H) STATEMENT WALK
+# ==============================================================================
+
+
+class TestWalkStatements:
+    """walk_statements yields the same statements as ast.walk."""
+
+    def test_matches_ast_walk_for_nested_statements(self):
+        import ast
+        from autocode.core.code.analyzer import walk_statements
+
+        code = (
+            "import os\n"
+            "try:\n"
+            "    import json\n"
+            "except ImportError:\n"
+            "    from x import y\n"
+            "def outer():\n"
+            "    class Inner:\n"
+            "        def m(self):\n"
+            "            return [lambda: 1]\n"
+            "    return Inner\n"
+            "match os.name:\n"
+            "    case 'nt':\n"
+            "        class Win: pass\n"
+        )
+        tree = ast.parse(code)
+        kinds = (ast.ClassDef, ast.FunctionDef, ast.Import, ast.ImportFrom)
+
+        expected = [n for n in ast.walk(tree) if isinstance(n, kinds)]
+        result = [n for n in walk_statements(tree) if isinstance(n, kinds)]
+
+        assert result == expected
+        assert [n.name for n in result if isinstance(n, ast.ClassDef)] == ["Inner", "Win"]
+
+    def test_does_not_yield_expressions(self):
+        import ast
+        from autocode.core.code.analyzer import walk_statements
+
+        tree = ast.parse("x = [i * 2 for i in range(10)]\n")
+
+        assert not any(isinstance(n, ast.expr) for n in walk_statements(tree))
+
+
+# ==============================================================================
+# I) CONTENT CACHE
+# ==============================================================================
+
+
+class TestAnalyzeFileMetricsCache:
+    """analyze_file_metrics memoizes results by (path, content digest)."""
+
+    def test_same_content_is_analyzed_once(self):
+        from unittest.mock import patch
+        import autocode.core.code.analyzer as analyzer
+
+        code = "def cached_once(a):\n    return a + 1\n"
+        with patch.object(
+            analyzer, "_compute_file_metrics", wraps=analyzer._compute_file_metrics
+        ) as mock_compute:
+            first = analyzer.analyze_file_metrics("cache_once.py", code)
+            second = analyzer.analyze_file_metrics("cache_once.py", code)
+
+        assert mock_compute.call_count == 1
+        assert second is first
+
+    def test_changed_content_or_path_is_reanalyzed(self):
+        from autocode.core.code.analyzer import analyze_file_metrics
+
+        before = analyze_file_metrics("cache_change.py", "def f():\n    return 1\n")
+        after = analyze_file_metrics(
+            "cache_change.py", "def f():\n    return 1\n\ndef g():\n    return 2\n"
+        )
+        moved = analyze_file_metrics("moved/cache_change.py", "def f():\n    return 1\n")
+
+        assert before.functions_count == 1
+        assert after.functions_count == 2
+        assert moved.path == "moved/cache_change.py"
+
+    def test_cache_is_bounded(self):
+        from unittest.mock import patch
+        import autocode.core.code.analyzer as analyzer
+
+        with patch.object(analyzer, "_FILE_METRICS_CACHE", {}), \
+             patch.object(analyzer, "_FILE_METRICS_CACHE_MAX", 2):
+            for i in range(5):
+                analyzer.analyze_file_metrics(f"bounded_{i}.py", f"x = {i}\n")
+            assert len(analyzer._FILE_METRICS_CACHE) == 2
+
+    def test_concurrent_eviction_is_safe(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        import autocode.core.code.analyzer as analyzer
+
+        with patch.object(analyzer, "_FILE_METRICS_CACHE", {}), \
+             patch.object(analyzer, "_FILE_METRICS_CACHE_MAX", 4):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(
+                    lambda i: analyzer.analyze_file_metrics(f"conc_{i % 16}.py", f"x = {i % 16}\n"),
+                    range(400),
+                ))
+            assert len(analyzer._FILE_METRICS_CACHE) <= 4
+
+        assert [fm.path for fm in results] == [f"conc_{i % 16}.py" for i in range(400)]
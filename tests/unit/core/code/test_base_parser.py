@@ -0,0 +1,120 @@
+"""
+Unit tests for autocode.core.code.parsers.base module.
+
+Tests cover: the per-file (mtime, size) cache BaseParser.parse_flat keeps in
+front of each parser's _parse_file, run against every concrete parser.
+
+All tests use tmp_path for filesystem isolation.
+"""
+import os
+
+import pytest
+
+from autocode.core.code.parsers import JSParser, PythonParser
+
+
+def _py_function(name: str) -> str:
+    return f"def {name}():\n    pass\n"
+
+
+def _js_function(name: str) -> str:
+    return f"function {name}() {{}}\n"
+
+
+@pytest.fixture(params=[
+    (PythonParser, ".py", _py_function),
+    (JSParser, ".js", _js_function),
+], ids=["python", "javascript"])
+def language(request):
+    """(parser class, file extension, source factory for one function)."""
+    return request.param
+
+
+# ==============================================================================
+# PARSE_FLAT CACHE
+# ==============================================================================
+
+
+class TestParseFlatCache:
+    """parse_flat reuses results for unchanged files."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, language):
+        from unittest.mock import patch
+
+        parser_cls, ext, source = language
+        path = tmp_path / f"mod{ext}"
+        path.write_text(source("f"))
+        parser = parser_cls()
+        parser.parse_flat(str(path))
+
+        with patch.object(parser_cls, "_parse_file") as mock_parse:
+            nodes = parser.parse_flat(str(path))
+
+        mock_parse.assert_not_called()
+        assert [n.name for n in nodes] == [f"mod{ext}", "f"]
+
+    def test_returned_file_node_is_an_independent_copy(self, tmp_path, language):
+        parser_cls, ext, source = language
+        path = tmp_path / f"mod{ext}"
+        path.write_text(source("f"))
+        parser = parser_cls()
+
+        first = parser.parse_flat(str(path))
+        first[0].parent_id = "somewhere"
+        second = parser.parse_flat(str(path))
+
+        assert second[0] is not first[0]
+        assert second[0].parent_id is None
+
+    def test_only_file_node_is_copied(self, tmp_path, language):
+        parser_cls, ext, source = language
+        path = tmp_path / f"mod{ext}"
+        path.write_text(source("f"))
+        parser = parser_cls()
+
+        first = parser.parse_flat(str(path))
+        second = parser.parse_flat(str(path))
+
+        assert second[1] is first[1]
+
+    def test_modified_file_is_reparsed(self, tmp_path, language):
+        parser_cls, ext, source = language
+        path = tmp_path / f"mod{ext}"
+        path.write_text(source("a"))
+        parser = parser_cls()
+        parser.parse_flat(str(path))
+
+        path.write_text(source("a") + source("b"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        nodes = parser.parse_flat(str(path))
+
+        assert [n.name for n in nodes if n.type == "function"] == ["a", "b"]
+
+    def test_same_relative_path_after_cwd_change(self, tmp_path, monkeypatch, language):
+        parser_cls, ext, source = language
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / f"mod{ext}").write_text(source(f"f{name}"))
+            os.utime(tmp_path / name / f"mod{ext}", ns=(0, 1_000_000_000))
+        parser = parser_cls()
+
+        monkeypatch.chdir(tmp_path / "a")
+        first = parser.parse_flat(f"mod{ext}")
+        monkeypatch.chdir(tmp_path / "b")
+        second = parser.parse_flat(f"mod{ext}")
+
+        assert [n.name for n in first][1:] == ["fa"]
+        assert [n.name for n in second][1:] == ["fb"]
+
+    def test_other_spelling_of_same_file_gets_its_own_ids(self, tmp_path, monkeypatch, language):
+        parser_cls, ext, source = language
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / f"mod{ext}").write_text(source("f"))
+        monkeypatch.chdir(tmp_path)
+        parser = parser_cls()
+
+        parser.parse_flat(f"pkg/mod{ext}")
+        nodes = parser.parse_flat(str(tmp_path / "pkg" / f"mod{ext}"))
+
+        assert nodes[1].id == f"{tmp_path / 'pkg' / f'mod{ext}'}::f"
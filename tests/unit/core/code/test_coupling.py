@@ -170,6 +170,20 @@ class TestExtractPythonImports:
         # All 3 are internal
         assert len(result) == 3
 
+    def test_skips_parse_when_no_package_is_mentioned(self):
+        """Content that never names a project package is not parsed at all."""
+        from unittest.mock import patch
+        from autocode.core.code.coupling import _extract_python_imports
+
+        content = "import os\nimport json\n"
+        with patch("autocode.core.code.coupling.ast.parse") as mock_parse:
+            result = _extract_python_imports(
+                "autocode/core/code/metrics.py", content, {"autocode"}
+            )
+
+        assert result == []
+        mock_parse.assert_not_called()
+
 
 # ==============================================================================
 # C) ANALYZE COUPLING (full pipeline)
@@ -214,6 +228,21 @@ class TestAnalyzeCoupling:
         # No circulars
         assert circulars == []
 
+    def test_unsupported_files_are_not_read(self):
+        """Files that are neither Python nor JS are skipped before reading."""
+        from autocode.core.code.coupling import analyze_coupling
+
+        read_paths = []
+
+        def patched_read(self, *args, **kwargs):
+            read_paths.append(str(self))
+            return "from autocode.web import x\n"
+
+        with patch.object(Path, "read_text", patched_read):
+            analyze_coupling(["autocode/core/a.py", "docs/readme.md", "autocode/web/b.jsx"])
+
+        assert sorted(read_paths) == ["autocode/core/a.py", "autocode/web/b.jsx"]
+
     def test_no_files_returns_empty(self):
         """No files → empty coupling and no circulars."""
         from autocode.core.code.coupling import analyze_coupling
@@ -459,6 +488,30 @@ class TestExtractJSImports:
         )
         assert len(result) == 1
 
+    def test_double_quoted_relative_import(self):
+        """Relative imports with double quotes pass the literal pre-check."""
+        from autocode.core.code.coupling import _extract_js_imports
+
+        content = 'import { foo } from "../utils/bar.js";\n'
+        result = _extract_js_imports(
+            "web/elements/index.js", content, {"web"}
+        )
+        assert result == [("web.elements", "web.utils")]
+
+    def test_skips_regex_without_relative_specifier(self):
+        """Files with no quoted './' or '../' never reach JS_IMPORT_RE."""
+        from unittest.mock import patch
+        from autocode.core.code.coupling import _extract_js_imports
+
+        content = "import { html } from 'lit';\nconst x = 1.5;\n"
+        with patch("autocode.core.code.coupling.JS_IMPORT_RE") as mock_re:
+            result = _extract_js_imports(
+                "web/elements/index.js", content, {"web"}
+            )
+
+        mock_re.finditer.assert_not_called()
+        assert result == []
+
 
 # ==============================================================================
 # E) MIXED-LANGUAGE COUPLING ANALYSIS (Commit 6)
@@ -3,8 +3,9 @@ test_health.py — Tests unitarios para autocode.core.code.health
 
 Cubre toda la API pública:
 - HealthConfig: defaults, overrides
-- load_thresholds(): lectura de TOML, fichero ausente, sección ausente, campos desconocidos
+- load_thresholds(): lectura de TOML, fichero ausente, sección ausente, campos desconocidos, cache por (mtime, size)
 - run_health_check(): pass/fail/warning, violations de MI, CC, nesting, rank F, circulares
+- get_health_check(): caché de FileMetrics por (mtime, size), acotada; fallo de os.stat
 """
 from __future__ import annotations
 
@@ -237,6 +238,34 @@ class TestLoadThresholds:
         config = load_thresholds(project_root=tmp_path)
         assert config.exclude == ["tests/*", "setup.py"]
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        """Un pyproject.toml sin cambios se lee de la cache."""
+        from unittest.mock import patch
+
+        toml = tmp_path / "pyproject.toml"
+        toml.write_text("[tool.codehealth]\ncritical_mi = 5.0\n")
+        first = load_thresholds(project_root=tmp_path)
+
+        with patch("autocode.core.code.health.tomllib.load") as mock_load:
+            second = load_thresholds(project_root=tmp_path)
+
+        mock_load.assert_not_called()
+        assert second is first
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path):
+        """Si cambia el pyproject.toml, se vuelve a leer."""
+        import os
+
+        toml = tmp_path / "pyproject.toml"
+        toml.write_text("[tool.codehealth]\ncritical_mi = 5.0\n")
+        load_thresholds(project_root=tmp_path)
+
+        toml.write_text("[tool.codehealth]\ncritical_mi = 9.0\n")
+        st = toml.stat()
+        os.utime(toml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert load_thresholds(project_root=tmp_path).critical_mi == 9.0
+
 
 # ==============================================================================
 # TEST RUN_HEALTH_CHECK
@@ -432,3 +461,77 @@ class TestRunHealthCheck:
         result = run_health_check(HealthConfig(critical_mi=20.0), bad_mi_metrics)
         for v in result.violations:
             assert v.level in ("critical", "warning")
+
+
+# ==============================================================================
+# TEST GET_HEALTH_CHECK
+# ==============================================================================
+
+
+class TestGetHealthCheckCache:
+    """get_health_check re-analyzes only files whose (mtime, size) changed."""
+
+    def _run(self, tmp_path, files):
+        from unittest.mock import patch
+        import autocode.core.code.analyzer as analyzer
+        from autocode.core.code.health import get_health_check
+
+        with patch("autocode.core.vcs.git.get_tracked_files", return_value=files), \
+             patch("autocode.core.code.coupling.analyze_coupling", return_value=([], [])), \
+             patch.object(
+                 analyzer, "analyze_file_metrics", wraps=analyzer.analyze_file_metrics
+             ) as mock_analyze:
+            result = get_health_check(strict=True, project_root=str(tmp_path))
+        return result, mock_analyze
+
+    def test_unchanged_files_are_not_reanalyzed(self, tmp_path):
+        (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+
+        first, _ = self._run(tmp_path, ["mod.py"])
+        second, mock_analyze = self._run(tmp_path, ["mod.py"])
+
+        mock_analyze.assert_not_called()
+        assert second.summary == first.summary
+
+    def test_modified_file_is_reanalyzed(self, tmp_path):
+        import os
+
+        path = tmp_path / "mod.py"
+        path.write_text("def f():\n    return 1\n")
+        self._run(tmp_path, ["mod.py"])
+
+        path.write_text("def f():\n    return 1\n\ndef g():\n    return 2\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        _, mock_analyze = self._run(tmp_path, ["mod.py"])
+
+        mock_analyze.assert_called_once()
+
+    def test_stat_failure_still_analyzes_file(self, tmp_path):
+        from unittest.mock import patch
+        import autocode.core.code.health as health
+
+        (tmp_path / "mod.py").write_text("def f():\n    return 1\n")
+
+        with patch("autocode.core.code.health.os.stat", side_effect=OSError("stat race")):
+            result, mock_analyze = self._run(tmp_path, ["mod.py"])
+
+        mock_analyze.assert_called_once()
+        assert result.summary["Files analyzed"] == "1"
+        assert (str(tmp_path.resolve()), "mod.py") not in health._HEALTH_METRICS_CACHE
+
+    def test_cache_is_bounded(self, tmp_path):
+        from unittest.mock import patch
+        import autocode.core.code.health as health
+
+        files = [f"mod{i}.py" for i in range(3)]
+        for name in files:
+            (tmp_path / name).write_text("x = 1\n")
+
+        with patch.object(health, "_HEALTH_METRICS_CACHE", {}), \
+             patch.object(health, "_HEALTH_METRICS_CACHE_MAX", 2):
+            self._run(tmp_path, files)
+            assert list(health._HEALTH_METRICS_CACHE) == [
+                (str(tmp_path.resolve()), "mod1.py"),
+                (str(tmp_path.resolve()), "mod2.py"),
+            ]
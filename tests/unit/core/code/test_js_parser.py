@@ -0,0 +1,166 @@
+"""
+Unit tests for autocode.core.code.parsers.js_parser module.
+
+Tests cover: parse_flat node extraction and block-end detection. The
+parse_flat cache is shared with PythonParser and tested in test_base_parser.py.
+
+All tests use tmp_path for filesystem isolation.
+"""
+
+
+# ==============================================================================
+# PARSE_FLAT
+# ==============================================================================
+
+
+class TestJSParserParseFlat:
+    """Flat node extraction from JavaScript files."""
+
+    def test_extracts_import_class_method_and_functions(self, tmp_path):
+        from autocode.core.code.parsers import JSParser
+
+        path = tmp_path / "mod.js"
+        path.write_text(
+            "import { html } from 'lit';\n"
+            "export class Panel extends Base {\n"
+            "  render() {\n"
+            "    return html`<div>${this.x}</div>`;\n"
+            "  }\n"
+            "}\n"
+            "export async function load(url) {\n"
+            "  return fetch(url);\n"
+            "}\n"
+            "const double = (x) => x * 2;\n"
+        )
+
+        nodes = JSParser().parse_flat(str(path))
+
+        assert nodes[0].type == "file"
+        assert [(n.type, n.name) for n in nodes[1:]] == [
+            ("import", "lit"),
+            ("class", "Panel"),
+            ("method", "render"),
+            ("function", "load"),
+            ("function", "double"),
+        ]
+        panel = nodes[2]
+        assert (panel.line_start, panel.line_end, panel.bases) == (2, 6, ["Base"])
+        load = nodes[4]
+        assert (load.line_start, load.line_end, load.is_async) == (7, 9, True)
+
+    def test_line_numbers_after_blank_and_multiline_prefix(self, tmp_path):
+        from autocode.core.code.parsers import JSParser
+
+        path = tmp_path / "lines.js"
+        path.write_text(
+            "\n"
+            "/* header\n"
+            "   comment */\n"
+            "class A {\n"
+            "  first() {}\n"
+            "  second() {}\n"
+            "}\n"
+            "function tail() {}\n"
+        )
+
+        nodes = JSParser().parse_flat(str(path))
+
+        assert [(n.name, n.line_start) for n in nodes[1:]] == [
+            ("A", 4), ("first", 5), ("second", 6), ("tail", 8),
+        ]
+
+
+class TestExtractMethods:
+    """Method detection inside class bodies."""
+
+    def test_async_and_multiline_params(self, tmp_path):
+        from autocode.core.code.parsers import JSParser
+
+        path = tmp_path / "methods.js"
+        path.write_text(
+            "class Store {\n"
+            "  async fetch(url,\n"
+            "              options) {\n"
+            "    this.cache = null;\n"
+            "  }\n"
+            "  reset () { this.cache = null; }\n"
+            "  count = 0;\n"
+            "}\n"
+        )
+
+        nodes = JSParser().parse_flat(str(path))
+
+        methods = [(n.name, n.is_async) for n in nodes if n.type == "method"]
+        assert methods == [("fetch", True), ("reset", None)]
+
+
+# ==============================================================================
+# _SCAN_DECLARATIONS
+# ==============================================================================
+
+
+class TestScanDeclarations:
+    """Single-pass declaration scan matches a finditer per pattern."""
+
+    def test_matches_each_pattern_finditer(self):
+        from autocode.core.code.parsers import JSParser
+
+        parser = JSParser()
+        content = (
+            "import a from 'a';\n"
+            "import {\n  b,\n  c\n} from 'bc';\n"
+            "export\nclass Foo extends Bar {}\n"
+            "export default async function load() {}\n"
+            "const f = (x) => x;\n"
+            "let g = async function (y) {};\n"
+            "var notAFunction = 1;\n"
+            "  const nested = () => 1;\n"
+        )
+        patterns = {
+            "import": parser.IMPORT_PATTERN,
+            "class": parser.CLASS_PATTERN,
+            "function": parser.FUNCTION_PATTERN,
+            "arrow": parser.ARROW_FUNCTION_PATTERN,
+            "expression": parser.FUNCTION_EXPRESSION_PATTERN,
+        }
+
+        declarations = parser._scan_declarations(content)
+
+        for kind, pattern in patterns.items():
+            expected = [m.span() for m in pattern.finditer(content)]
+            assert [m.span() for m in declarations[kind]] == expected, kind
+        assert [m.group("name") for m in declarations["class"]] == ["Foo"]
+
+
+# ==============================================================================
+# _FIND_BLOCK_END
+# ==============================================================================
+
+
+class TestFindBlockEnd:
+    """Balanced {} block detection."""
+
+    def test_nested_braces(self):
+        from autocode.core.code.parsers import JSParser
+
+        content = "function f() {\n  if (a) {\n    b({});\n  }\n}\nrest"
+
+        block, end_line = JSParser()._find_block_end(content, 0, 1)
+
+        assert block == content[content.index("{"):content.index("\nrest")]
+        assert end_line == 5
+
+    def test_unbalanced_block_runs_to_end_of_content(self):
+        from autocode.core.code.parsers import JSParser
+
+        content = "function f() {\n  {\n"
+
+        block, end_line = JSParser()._find_block_end(content, 0, 1)
+
+        assert block == "{\n  {\n"
+        assert end_line == 3
+
+    def test_no_brace_returns_empty_block(self):
+        from autocode.core.code.parsers import JSParser
+
+        assert JSParser()._find_block_end("const x = 1;", 0, 4) == ("", 4)
@@ -0,0 +1,116 @@
+"""
+Unit tests for autocode.core.code.parsers.python_parser module.
+
+Tests cover: parse_flat node extraction and get_parser. The parse_flat
+cache is shared with JSParser and tested in test_base_parser.py.
+
+All tests use tmp_path for filesystem isolation.
+"""
+
+
+# ==============================================================================
+# PARSE_FLAT
+# ==============================================================================
+
+
+class TestPythonParserParseFlat:
+    """Flat node extraction from Python files."""
+
+    def test_extracts_file_class_method_and_function(self, tmp_path):
+        from autocode.core.code.parsers import PythonParser
+
+        path = tmp_path / "mod.py"
+        path.write_text(
+            "import os\n"
+            "class A:\n"
+            "    def run(self, x):\n"
+            "        return x\n"
+            "def helper():\n"
+            "    return 1\n"
+        )
+
+        nodes = PythonParser().parse_flat(str(path))
+
+        assert nodes[0].type == "file"
+        assert [n.type for n in nodes[1:]] == ["import", "class", "method", "function"]
+        method = [n for n in nodes if n.type == "method"][0]
+        assert method.params == ["x"]
+
+    def test_async_definitions_are_extracted(self, tmp_path):
+        from autocode.core.code.parsers import PythonParser
+
+        path = tmp_path / "aio.py"
+        path.write_text(
+            "class Client:\n"
+            "    async def fetch(self):\n"
+            "        pass\n"
+            "async def main():\n"
+            "    pass\n"
+        )
+
+        nodes = PythonParser().parse_flat(str(path))
+
+        assert [(n.type, n.name) for n in nodes[1:]] == [
+            ("class", "Client"), ("method", "fetch"), ("function", "main"),
+        ]
+
+    def test_decorator_names(self, tmp_path):
+        from autocode.core.code.parsers import PythonParser
+
+        path = tmp_path / "decorated.py"
+        path.write_text(
+            "@plain\n"
+            "@pkg.mod.attr\n"
+            "@register(http_methods=['GET'])\n"
+            "@factory()()\n"
+            "@items[0]\n"
+            "def f():\n"
+            "    pass\n"
+        )
+
+        nodes = PythonParser().parse_flat(str(path))
+
+        func = [n for n in nodes if n.type == "function"][0]
+        assert func.decorators == ["plain", "pkg.mod.attr", "register", "factory", "unknown"]
+
+    def test_syntax_error_returns_only_file_node(self, tmp_path):
+        from autocode.core.code.parsers import PythonParser
+
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n")
+
+        nodes = PythonParser().parse_flat(str(path))
+
+        assert len(nodes) == 1
+        assert nodes[0].type == "file"
+
+    def test_reads_file_once(self, tmp_path):
+        from unittest.mock import patch
+        from autocode.core.code.parsers import PythonParser
+
+        path = tmp_path / "once.py"
+        path.write_text("def f():\n    return 1\n")
+        parser = PythonParser()
+
+        with patch.object(PythonParser, "_read_file", wraps=parser._read_file) as mock_read:
+            nodes = parser._parse_file(str(path))
+
+        assert mock_read.call_count == 1
+        assert nodes[0].loc == 2
+
+
+class TestGetParser:
+    """get_parser returns one shared parser instance per extension."""
+
+    def test_reuses_instance_case_insensitively(self):
+        from autocode.core.code.parsers import PythonParser, get_parser
+
+        parser = get_parser(".py")
+
+        assert isinstance(parser, PythonParser)
+        assert get_parser(".PY") is parser
+
+    def test_unknown_extension_returns_none(self):
+        from autocode.core.code.parsers import get_parser
+
+        assert get_parser(".rs") is None
@@ -122,6 +122,18 @@ class TestLoadSnapshotByHash:
         result = load_snapshot_by_hash("nonexistent_hash", metrics_dir=str(tmp_path / "metrics"))
         assert result is None
 
+    def test_skips_files_of_other_commits(self, tmp_path):
+        from autocode.core.code.snapshots import save_snapshot, load_snapshot_by_hash
+
+        metrics_dir = tmp_path / "metrics"
+        snapshot = _make_snapshot(commit_hash="abc123def456", commit_short="abc123d")
+        save_snapshot(snapshot, metrics_dir=str(metrics_dir))
+        (metrics_dir / "fff0000.json").write_text("{not json", encoding="utf-8")
+
+        result = load_snapshot_by_hash("abc123def456", metrics_dir=str(metrics_dir))
+        assert result is not None
+        assert result.commit_short == "abc123d"
+
     def test_returns_none_when_dir_missing(self, tmp_path):
         from autocode.core.code.snapshots import load_snapshot_by_hash
 
@@ -255,6 +267,88 @@ class TestLoadHistoryPoints:
         assert points[0].rank_d == 1
         assert points[0].circular_deps_count == 1
 
+    def test_ignores_dot_prefixed_files(self, tmp_path):
+        from autocode.core.code.snapshots import save_snapshot, load_history_points
+
+        metrics_dir = tmp_path / "metrics"
+        save_snapshot(_make_snapshot(commit_hash="hash_v", commit_short="hash_v"), metrics_dir=str(metrics_dir))
+        # Hidden files were never matched by the former "*.json" glob
+        (metrics_dir / ".hash_t.json").write_text(
+            _make_snapshot(commit_hash="hash_t", commit_short="hash_t").model_dump_json()
+        )
+
+        points = load_history_points(100, metrics_dir=str(metrics_dir))
+        assert [p.commit_hash for p in points] == ["hash_v"]
+
+    def test_reuses_points_for_unchanged_files(self, tmp_path):
+        from autocode.core.code.snapshots import save_snapshot, load_history_points
+
+        metrics_dir = str(tmp_path / "metrics")
+        save_snapshot(_make_snapshot(commit_hash="hash_c", commit_short="hash_c"), metrics_dir=metrics_dir)
+
+        first = load_history_points(100, metrics_dir=metrics_dir)
+        second = load_history_points(100, metrics_dir=metrics_dir)
+        assert first[0] is second[0]
+
+    def test_reparses_modified_files(self, tmp_path):
+        import os
+        from autocode.core.code.snapshots import save_snapshot, load_history_points
+
+        metrics_dir = str(tmp_path / "metrics")
+        save_snapshot(
+            _make_snapshot(commit_hash="hash_m", commit_short="hash_m", total_sloc=100),
+            metrics_dir=metrics_dir,
+        )
+        assert load_history_points(100, metrics_dir=metrics_dir)[0].total_sloc == 100
+
+        save_snapshot(
+            _make_snapshot(commit_hash="hash_m", commit_short="hash_m", total_sloc=300),
+            metrics_dir=metrics_dir,
+        )
+        path = tmp_path / "metrics" / "hash_m.json"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert load_history_points(100, metrics_dir=metrics_dir)[0].total_sloc == 300
+
+    def test_reparses_resized_file_with_same_mtime(self, tmp_path):
+        import os
+        from autocode.core.code.snapshots import save_snapshot, load_history_points
+
+        metrics_dir = str(tmp_path / "metrics")
+        save_snapshot(
+            _make_snapshot(commit_hash="hash_s", commit_short="hash_s", total_sloc=100),
+            metrics_dir=metrics_dir,
+        )
+        path = tmp_path / "metrics" / "hash_s.json"
+        mtime_ns = path.stat().st_mtime_ns
+        assert load_history_points(100, metrics_dir=metrics_dir)[0].total_sloc == 100
+
+        save_snapshot(
+            _make_snapshot(commit_hash="hash_s", commit_short="hash_s", total_sloc=100_000),
+            metrics_dir=metrics_dir,
+        )
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        assert load_history_points(100, metrics_dir=metrics_dir)[0].total_sloc == 100_000
+
+    def test_prunes_points_of_deleted_snapshots(self, tmp_path):
+        from autocode.core.code import snapshots
+        from autocode.core.code.snapshots import save_snapshot, load_history_points
+
+        metrics_dir = str(tmp_path / "metrics")
+        for h in ("hash_1", "hash_2"):
+            save_snapshot(_make_snapshot(commit_hash=h, commit_short=h), metrics_dir=metrics_dir)
+        load_history_points(100, metrics_dir=metrics_dir)
+
+        gone = tmp_path / "metrics" / "hash_1.json"
+        gone.unlink()
+        points = load_history_points(100, metrics_dir=metrics_dir)
+
+        assert [p.commit_hash for p in points] == ["hash_2"]
+        assert str(gone.resolve()) not in snapshots._HISTORY_POINT_CACHE
+        assert str((tmp_path / "metrics" / "hash_2.json").resolve()) in snapshots._HISTORY_POINT_CACHE
+
 
 # ==========================================================================
 # TestListSnapshots
@@ -294,6 +388,32 @@ class TestListSnapshots:
             assert "avg_complexity" in entry
             assert "avg_mi" in entry
 
+    def test_partial_snapshot_uses_defaults(self, tmp_path):
+        """Only aggregate keys are read; missing ones fall back to defaults."""
+        import json
+        from autocode.core.code.snapshots import list_snapshots
+
+        metrics_dir = tmp_path / "metrics"
+        metrics_dir.mkdir()
+        (metrics_dir / "partial.json").write_text(json.dumps({
+            "commit_short": "abc1234",
+            "total_sloc": 42,
+            "files": [{"path": "a.py", "anything": [1, 2, 3]}],
+        }))
+
+        result = list_snapshots(metrics_dir=str(metrics_dir))
+
+        assert result == [{
+            "filename": "partial.json",
+            "commit_short": "abc1234",
+            "branch": "",
+            "timestamp": "",
+            "total_files": 0,
+            "total_sloc": 42,
+            "avg_complexity": 0.0,
+            "avg_mi": 0.0,
+        }]
+
     def test_returns_empty_when_no_dir(self, tmp_path):
         from autocode.core.code.snapshots import list_snapshots
 
@@ -354,6 +474,25 @@ class TestSnapshotWithJSFiles:
         assert ".mjs" in extensions
         assert ".jsx" in extensions
 
+    def test_snapshot_collects_background_results(self, _mock_git):
+        """HEAD refs and coupling computed alongside file analysis end up in the snapshot."""
+        from autocode.core.code.metrics import _build_current_snapshot
+        from autocode.core.code.models import PackageCoupling
+
+        _mock_git["get_files"].return_value = []
+        _mock_git["coupling"].return_value = (
+            [PackageCoupling(name="pkg.a", ce=1, ca=0, instability=1.0)],
+            [["pkg.a", "pkg.b"]],
+        )
+
+        snapshot = _build_current_snapshot()
+
+        assert (snapshot.commit_hash, snapshot.commit_short, snapshot.branch) == (
+            "abc123def456", "abc123d", "main",
+        )
+        assert [c.name for c in snapshot.coupling] == ["pkg.a"]
+        assert snapshot.circular_deps == [["pkg.a", "pkg.b"]]
+
     def test_snapshot_includes_js_metrics(self, _mock_git):
         """Snapshot built with JS files should include their FileMetrics."""
         from autocode.core.code.metrics import _build_current_snapshot
@@ -426,3 +565,107 @@ class TestSnapshotWithJSFiles:
         # Complexity distribution should include all functions
         assert snapshot.avg_complexity == 3.0
         assert snapshot.complexity_distribution.get("A", 0) == 3
+
+    def test_snapshot_without_functions(self, _mock_git):
+        """Files with no functions aggregate to zero complexity and an empty distribution."""
+        from autocode.core.code.metrics import _build_current_snapshot
+        from autocode.core.code.models import FileMetrics
+
+        _mock_git["get_files"].return_value = ["a.py", "b.py"]
+        _mock_git["analyze"].side_effect = lambda path, content: FileMetrics(
+            path=path, language="python", sloc=10, comments=1, blanks=2,
+            total_loc=13, maintainability_index=90.0 if path == "a.py" else 60.0,
+        )
+
+        snapshot = _build_current_snapshot()
+
+        assert (snapshot.total_sloc, snapshot.total_comments, snapshot.total_blanks) == (20, 2, 4)
+        assert snapshot.avg_mi == 75.0
+        assert snapshot.avg_complexity == 0
+        assert snapshot.complexity_distribution == {}
+
+
+# ==========================================================================
+# TestCommitMetricsCache
+# ==========================================================================
+
+
+class TestCommitMetricsCache:
+    """Tests for save/load_commit_metrics() and their use in _analyze_commit()."""
+
+    FULL_HASH = "a" * 40
+
+    def test_roundtrip(self, tmp_path):
+        from autocode.core.code.models import CommitMetrics
+        from autocode.core.code.snapshots import save_commit_metrics, load_commit_metrics
+
+        metrics = CommitMetrics(
+            commit_hash=self.FULL_HASH, commit_short="aaaaaaa",
+            summary={"delta_sloc": 5},
+        )
+        save_commit_metrics(metrics, metrics_dir=str(tmp_path))
+
+        loaded = load_commit_metrics(self.FULL_HASH, metrics_dir=str(tmp_path))
+        assert loaded == metrics
+
+    def test_missing_returns_none(self, tmp_path):
+        from autocode.core.code.snapshots import load_commit_metrics
+
+        assert load_commit_metrics(self.FULL_HASH, metrics_dir=str(tmp_path)) is None
+
+    def test_metrics_from_another_format_are_ignored(self, tmp_path):
+        from autocode.core.code.snapshots import load_commit_metrics
+
+        # Unversioned layout used before the format directory existed
+        (tmp_path / f"{self.FULL_HASH}.json").write_text(
+            '{"commit_hash": "%s", "commit_short": "aaaaaaa"}' % self.FULL_HASH
+        )
+        old_format = tmp_path / "v0-lizard0" / f"{self.FULL_HASH}.json"
+        old_format.parent.mkdir()
+        old_format.write_text(
+            '{"commit_hash": "%s", "commit_short": "aaaaaaa"}' % self.FULL_HASH
+        )
+
+        assert load_commit_metrics(self.FULL_HASH, metrics_dir=str(tmp_path)) is None
+
+    def test_analyze_commit_survives_failed_save(self):
+        from unittest.mock import patch
+        from autocode.core.code.metrics import _analyze_commit
+
+        with patch("autocode.core.code.metrics.git", return_value=self.FULL_HASH), \
+             patch("autocode.core.code.metrics.load_commit_metrics", return_value=None), \
+             patch("autocode.core.code.metrics.save_commit_metrics",
+                   side_effect=OSError("read-only file system")) as mock_save, \
+             patch("autocode.core.code.metrics._get_commit_changed_files", return_value=[]):
+            result = _analyze_commit("aaaaaaa")
+
+        mock_save.assert_called_once()
+        assert result.commit_hash == self.FULL_HASH
+
+    def test_analyze_commit_reuses_cached_result(self):
+        from unittest.mock import patch
+        from autocode.core.code.models import CommitMetrics
+        from autocode.core.code.metrics import _analyze_commit
+
+        cached = CommitMetrics(commit_hash=self.FULL_HASH, commit_short="aaaaaaa")
+        with patch("autocode.core.code.metrics.git", return_value=self.FULL_HASH), \
+             patch("autocode.core.code.metrics.load_commit_metrics", return_value=cached), \
+             patch("autocode.core.code.metrics._get_commit_changed_files") as mock_changed:
+            result = _analyze_commit("aaaaaaa")
+
+        assert result is cached
+        mock_changed.assert_not_called()
+
+    def test_analyze_commit_does_not_cache_unresolved_refs(self):
+        from unittest.mock import patch
+        from autocode.core.code.metrics import _analyze_commit
+
+        # git rev-parse echoes unknown refs back instead of a hash
+        with patch("autocode.core.code.metrics.git", return_value="no-such-ref"), \
+             patch("autocode.core.code.metrics.load_commit_metrics") as mock_load, \
+             patch("autocode.core.code.metrics.save_commit_metrics") as mock_save, \
+             patch("autocode.core.code.metrics._get_commit_changed_files", return_value=[]):
+            _analyze_commit("no-such-ref")
+
+        mock_load.assert_not_called()
+        mock_save.assert_not_called()
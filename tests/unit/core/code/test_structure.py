@@ -0,0 +1,44 @@
+"""
+Unit tests for autocode.core.code.structure module.
+
+Tests cover: _render_summary_tree per-file class/function counts.
+"""
+from autocode.core.code.models import CodeNode
+
+
+# ==============================================================================
+# RENDER SUMMARY TREE
+# ==============================================================================
+
+
+def _node(id, parent_id, name, type, loc=0):
+    return CodeNode(id=id, parent_id=parent_id, name=name, type=type, path=id, loc=loc)
+
+
+class TestRenderSummaryTree:
+    """Compact tree lines with inline class/function counts."""
+
+    def test_counts_classes_functions_and_methods(self):
+        from autocode.core.code.structure import _render_summary_tree
+
+        nodes = [
+            _node("src", ".", "src", "directory", loc=12),
+            _node("src/mod.py", "src", "mod.py", "file", loc=12),
+            _node("src/mod.py::A", "src/mod.py", "A", "class"),
+            _node("src/mod.py::A.run", "src/mod.py::A", "run", "method"),
+            _node("src/mod.py::A.stop", "src/mod.py::A", "stop", "method"),
+            _node("src/mod.py::B", "src/mod.py", "B", "class"),
+            _node("src/mod.py::helper", "src/mod.py", "helper", "function"),
+            _node("src/mod.py::os", "src/mod.py", "os", "import"),
+        ]
+        children_map = {}
+        for n in nodes:
+            children_map.setdefault(n.parent_id, []).append(n)
+        lines = []
+
+        _render_summary_tree(".", children_map, {n.id: n for n in nodes}, lines, prefix="")
+
+        assert lines == [
+            "└── src/ (12 LOC)",
+            "    └── mod.py (12 LOC, 2c, 3f)",
+        ]
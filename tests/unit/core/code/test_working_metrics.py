@@ -286,3 +286,32 @@ class TestGetWorkingChangesMetricsEndpoint:
 
         assert exc_info.value.status_code == 500
         assert "git error" in exc_info.value.detail
+
+
+# ===========================================================================
+# TestParseNameStatus
+# ===========================================================================
+
+
+class TestParseNameStatus:
+    """Tests for _parse_name_status(), shared by commit and working analysis."""
+
+    def test_maps_statuses_and_skips_non_code_files(self):
+        """Status letters map to names; only .py/JS files are kept."""
+        from autocode.core.code.metrics import _parse_name_status
+
+        output = (
+            "A\tsrc/new.py\n"
+            "M\tweb/app.js\n"
+            "D\tsrc/old.py\n"
+            "R100\tsrc/before.py\tsrc/after.py\n"
+            "M\tREADME.md\n"
+            "\n"
+        )
+
+        assert _parse_name_status(output) == [
+            ("added", "src/new.py"),
+            ("modified", "web/app.js"),
+            ("deleted", "src/old.py"),
+            ("modified", "src/after.py"),
+        ]
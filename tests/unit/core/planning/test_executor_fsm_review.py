@@ -226,6 +226,41 @@ class TestReviewModeAutoRejected:
         assert complete["data"]["commit_hash"] == ""
 
 
+class TestReviewRunsOffEventLoop:
+    """Blocking review and commit calls run in a worker thread."""
+
+    @pytest.mark.asyncio
+    async def test_auto_review_and_commit_run_in_worker_thread(self):
+        import threading
+        from autocode.core.planning.executor import _run_review_flow
+        from autocode.core.planning.models import ReviewResult
+
+        plan = _make_plan()
+        plan.execution = PlanExecutionState(started_at="2026-01-01T12:00:00")
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def _review(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return ReviewResult(mode="auto", verdict="approved", reviewed_by="auto")
+
+        def _commit(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return "abc"
+
+        with (
+            patch("autocode.core.planning.executor.auto_review", side_effect=_review),
+            patch("autocode.core.planning.executor.git_add_and_commit", side_effect=_commit),
+            _patch_save_plan(),
+        ):
+            async for _ in _run_review_flow(plan, "auto", ["a.py"]):
+                pass
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+        assert plan.execution.commit_hash == "abc"
+
+
 # ============================================================================
 # TEST: REVIEW FLOW YIELDS ONLY STRINGS — NO MIXED TYPES
 # ============================================================================
@@ -58,6 +58,61 @@ class TestSavePlan:
         data = json.loads((tmp_path / "20260101-000003.json").read_text())
         assert data["title"] == "Updated"
 
+    def test_save_unchanged_plan_does_not_rewrite(self, tmp_path):
+        """Guardar el mismo plan dos veces no reescribe el archivo."""
+        plan = CommitPlan(id="20260101-000004", title="Same")
+        plan_file = tmp_path / "20260101-000004.json"
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            save_plan(plan)
+            inode = plan_file.stat().st_ino
+            save_plan(plan)
+        assert plan_file.stat().st_ino == inode
+        assert [p.name for p in tmp_path.iterdir()] == ["20260101-000004.json"]
+
+    def test_concurrent_saves_use_distinct_temp_files(self, tmp_path):
+        """Cada escritura usa su propio temporal, aunque el destino sea el mismo."""
+        from autocode.core.utils import fs
+
+        plan = CommitPlan(id="20260101-000005", title="Temp")
+        temps = []
+        real_replace = fs.os.replace
+
+        def spy_replace(src, dst):
+            temps.append(src)
+            real_replace(src, dst)
+
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)), \
+             patch.object(fs.os, "replace", side_effect=spy_replace):
+            save_plan(plan)
+            plan.title = "Temp 2"
+            save_plan(plan)
+        assert len(set(temps)) == 2
+        assert [p.name for p in tmp_path.iterdir()] == ["20260101-000005.json"]
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        """Si falla el reemplazo, el temporal se borra y el plan previo queda intacto."""
+        plan = CommitPlan(id="20260101-000006", title="Before")
+        plan_file = tmp_path / "20260101-000006.json"
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            save_plan(plan)
+            plan.title = "After"
+            with patch("autocode.core.utils.fs.os.replace", side_effect=OSError("boom")):
+                with pytest.raises(OSError):
+                    save_plan(plan)
+        assert json.loads(plan_file.read_text())["title"] == "Before"
+        assert [p.name for p in tmp_path.iterdir()] == ["20260101-000006.json"]
+
+    def test_rewrite_keeps_file_permissions(self, tmp_path):
+        """La reescritura conserva los permisos del archivo existente."""
+        plan = CommitPlan(id="20260101-000007", title="Mode")
+        plan_file = tmp_path / "20260101-000007.json"
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            save_plan(plan)
+            plan_file.chmod(0o640)
+            plan.title = "Mode 2"
+            save_plan(plan)
+        assert plan_file.stat().st_mode & 0o777 == 0o640
+
 
 class TestLoadPlan:
     """Tests for load_plan() — load plan by ID."""
@@ -80,6 +135,13 @@ class TestLoadPlan:
             result = load_plan("nonexistent-plan")
         assert result is None
 
+    def test_load_returns_none_if_corrupt(self, tmp_path):
+        """load_plan retorna None si el JSON del plan es inválido."""
+        (tmp_path / "20260101-000012.json").write_text("{not json", encoding="utf-8")
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            result = load_plan("20260101-000012")
+        assert result is None
+
     def test_load_preserves_all_fields(self, tmp_path):
         """load_plan preserva todos los campos del plan."""
         plan = CommitPlan(
@@ -184,6 +246,33 @@ class TestListPlanSummaries:
         assert result[-1].id == "20260101-000050"
 
 
+    def test_unchanged_plans_are_not_reparsed(self, tmp_path):
+        """Un segundo listado reutiliza los resúmenes de archivos sin cambios."""
+        plan = CommitPlan(id="20260101-000070", title="Cached")
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            save_plan(plan)
+            with patch(
+                "autocode.core.planning.persistence.json.load", wraps=json.load
+            ) as mock_load:
+                first = list_plan_summaries()
+                assert mock_load.call_count == 1
+                mock_load.reset_mock()
+                second = list_plan_summaries()
+        mock_load.assert_not_called()
+        assert second == first
+
+    def test_saved_changes_are_listed_immediately(self, tmp_path):
+        """save_plan invalida el resumen aunque mtime y tamaño no cambien."""
+        plan = CommitPlan(id="20260101-000071", title="Status", status="draft")
+        with patch("autocode.core.planning.persistence.PLANS_DIR", str(tmp_path)):
+            save_plan(plan)
+            assert list_plan_summaries()[0].status == "draft"
+            plan.status = "ready"
+            save_plan(plan)
+            result = list_plan_summaries()
+        assert result[0].status == "ready"
+
+
 class TestDeletePlan:
     """Tests for delete_plan() — delete plan by ID."""
 
@@ -0,0 +1,35 @@
+"""
+Unit tests for the shared OpenRouter HTTP client.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from autocode.core.utils import openrouter
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    openrouter.close_client()
+    yield
+    openrouter.close_client()
+
+
+class TestSharedClient:
+
+    def test_lookups_share_one_client(self):
+        assert openrouter._get_client() is openrouter._get_client()
+
+    def test_concurrent_first_use_creates_one_client(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: openrouter._get_client(), range(32)))
+
+        assert len({id(c) for c in clients}) == 1
+
+    def test_close_client_closes_and_resets(self):
+        client = openrouter._get_client()
+
+        openrouter.close_client()
+
+        assert client.is_closed
+        assert openrouter._get_client() is not client
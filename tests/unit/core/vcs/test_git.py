@@ -179,6 +179,100 @@ class TestGitShow:
         )
 
 
+# ==============================================================================
+# TestGitShowBatch — many refs through one git process
+# ==============================================================================
+
+
+class TestGitShowBatch:
+    """Tests for git_show_batch() — `git cat-file --batch` reader."""
+
+    def test_parses_contents_and_missing_refs(self):
+        """Each ref maps to its content, or None when git reports it missing."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = (
+                b"aaa blob 6\nx = 1\n\n"
+                b"HEAD:gone.py missing\n"
+                b"bbb blob 0\n\n"
+            )
+
+            from autocode.core.vcs.git import git_show_batch
+
+            result = git_show_batch(["HEAD:a.py", "HEAD:gone.py", "HEAD:empty.py"], cwd="/tmp/repo")
+
+        assert result == {"HEAD:a.py": "x = 1\n", "HEAD:gone.py": None, "HEAD:empty.py": ""}
+        mock_run.assert_called_once_with(
+            ["git", "cat-file", "--batch=%(objectname) %(objecttype) %(objectsize)"],
+            input=b"HEAD:a.py\nHEAD:gone.py\nHEAD:empty.py\n",
+            capture_output=True, check=False, cwd="/tmp/repo",
+        )
+
+    def test_missing_ref_with_spaces(self):
+        """A missing path containing spaces doesn't break header parsing."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = (
+                b"HEAD:a b.py missing\n"
+                b"HEAD:my dir/x y.py ambiguous\n"
+                b"ccc blob 3\nok\n\n"
+            )
+
+            from autocode.core.vcs.git import git_show_batch
+
+            result = git_show_batch(["HEAD:a b.py", "HEAD:my dir/x y.py", "HEAD:c.py"])
+
+        assert result == {"HEAD:a b.py": None, "HEAD:my dir/x y.py": None, "HEAD:c.py": "ok\n"}
+
+    def test_undecodable_content_is_none(self):
+        """Non-UTF-8 blobs map to None (strict decoding), later refs still parse."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = (
+                b"aaa blob 2\n\xff\xfe\n"
+                b"bbb blob 3\nok\n\n"
+            )
+
+            from autocode.core.vcs.git import git_show_batch
+
+            result = git_show_batch(["HEAD:bin.py", "HEAD:ok.py"])
+
+        assert result == {"HEAD:bin.py": None, "HEAD:ok.py": "ok\n"}
+
+    def test_crlf_content_matches_git_show(self):
+        """CRLF blobs come back with \\n newlines, as git_show's text mode returns them."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"aaa blob 14\nx = 1\r\ny = 2\r\n\n"
+
+            from autocode.core.vcs.git import git_show_batch
+
+            result = git_show_batch(["HEAD:win.py"])
+
+        assert result == {"HEAD:win.py": "x = 1\ny = 2\n"}
+
+    def test_empty_refs_skips_subprocess(self):
+        """No refs → no git process."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            from autocode.core.vcs.git import git_show_batch
+
+            assert git_show_batch([]) == {}
+
+        mock_run.assert_not_called()
+
+    def test_git_failure_returns_none_for_all(self):
+        """git exiting non-zero (e.g., not a repo) → every ref is None."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 128
+            mock_run.return_value.stdout = b""
+
+            from autocode.core.vcs.git import git_show_batch
+
+            result = git_show_batch(["HEAD:a.py"])
+
+        assert result == {"HEAD:a.py": None}
+
+
 # ==============================================================================
 # TestGitAddAndCommit
 # ==============================================================================
@@ -378,6 +472,20 @@ class TestGetTrackedFiles:
         assert "b.js" not in result
         assert "d.txt" not in result
 
+    def test_extension_match_ignores_dotted_dirs_and_bare_dotfiles(self):
+        """Only the final component's suffix counts, as with Path.suffix."""
+        with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
+            mock_run.return_value.stdout = (
+                "pkg.py/README\npkg.v2/mod.py\nweb/.eslintrc.js\nconf/.py\n"
+            )
+            mock_run.return_value.returncode = 0
+
+            from autocode.core.vcs.git import get_tracked_files
+
+            result = get_tracked_files(".py", ".js")
+
+        assert result == ["pkg.v2/mod.py", "web/.eslintrc.js"]
+
     def test_passes_cwd(self):
         """get_tracked_files() passes cwd parameter to subprocess."""
         with patch("autocode.core.vcs.git.subprocess.run") as mock_run:
@@ -6,6 +6,7 @@ Covers:
 - Marker registration (health marker via pytest_configure)
 - Session fixtures provided by the plugin:
     - health_config  → HealthConfig
+    - autocode_tracked_files  → list[str] (exclude globs applied)
     - all_file_metrics → list[FileMetrics]
     - coupling_result  → tuple(coupling, circulars)
 
@@ -14,6 +15,8 @@ tests/health/conftest.py fixtures, which are scoped to tests/health/).
 """
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from autocode.core.code.health import HealthConfig
@@ -74,6 +77,12 @@ class TestPluginFixtures:
         assert hasattr(health_config, "max_circular_deps")
         assert hasattr(health_config, "exclude")
 
+    def test_tracked_files_respects_exclude(self, autocode_tracked_files, health_config):
+        """Fixture autocode_tracked_files devuelve paths sin los excluidos por config."""
+        assert isinstance(autocode_tracked_files, list)
+        for f in autocode_tracked_files:
+            assert not any(Path(f).match(p) for p in health_config.exclude)
+
     def test_all_file_metrics_fixture_type(self, all_file_metrics):
         """Fixture all_file_metrics devuelve una lista."""
         assert isinstance(all_file_metrics, list), (
@@ -118,3 +127,54 @@ class TestPluginFixtures:
         assert isinstance(circulars, list), (
             f"circulars debe ser list, got {type(circulars)}"
         )
+
+
+# ==============================================================================
+# FILE ANALYSIS WORKER
+# ==============================================================================
+
+
+class TestAnalyzePath:
+    """Worker de análisis por archivo usado por all_file_metrics."""
+
+    def test_returns_file_metrics(self, tmp_path):
+        from autocode.testing.plugin import _analyze_path
+
+        path = tmp_path / "mod.py"
+        path.write_text("def f():\n    return 1\n")
+
+        fm = _analyze_path(str(path))
+
+        assert isinstance(fm, FileMetrics)
+        assert fm.functions_count == 1
+
+    def test_unreadable_file_returns_none(self, tmp_path):
+        from autocode.testing.plugin import _analyze_path
+
+        assert _analyze_path(str(tmp_path / "missing.py")) is None
+
+
+class TestAnalyzePaths:
+    """all_file_metrics solo arranca procesos si el consumidor lo activa."""
+
+    def test_serial_by_default(self):
+        from unittest.mock import patch
+        from autocode.testing import plugin
+
+        paths = [f"missing_{i}.py" for i in range(plugin._PARALLEL_MIN_FILES)]
+        with patch.object(plugin, "ProcessPoolExecutor") as mock_pool:
+            result = plugin._analyze_paths(paths, HealthConfig().parallel_workers)
+
+        mock_pool.assert_not_called()
+        assert result == [None] * len(paths)
+
+    def test_opt_in_uses_process_pool(self):
+        from unittest.mock import patch
+        from autocode.testing import plugin
+
+        paths = [f"missing_{i}.py" for i in range(plugin._PARALLEL_MIN_FILES)]
+        with patch.object(plugin, "ProcessPoolExecutor") as mock_pool:
+            mock_pool.return_value.__enter__.return_value.map.return_value = iter([None] * len(paths))
+            plugin._analyze_paths(paths, workers=4)
+
+        mock_pool.assert_called_once_with(max_workers=4)